@@ -1,15 +1,54 @@
-from fastapi import FastAPI
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from routes.questions import router as questions_router
-from routes.hybrid_search import router as hybrid_search_router
+from routes.hybrid_search import router as hybrid_search_router, get_search_service
 from routes.interviews import router as interviews_router
+from services.http_client import close_async_client
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Pre-warm the search service at startup so the first request doesn't
+    pay the multi-second embedding-model load and index restore.
+    """
+    try:
+        service = await asyncio.to_thread(get_search_service)
+        await asyncio.to_thread(
+            service.hybrid_matcher.embeddings.embed_query, "warmup")
+        if service.hybrid_matcher.bm25_retriever is not None:
+            await asyncio.to_thread(
+                service.hybrid_matcher.bm25_retriever.invoke, "warmup")
+    except Exception as e:
+        # Warm-up is best effort; the first request falls back to lazy init
+        logger.warning("Startup pre-warm failed: %s", e)
+    yield
+    await close_async_client()
+
 
 app = FastAPI(
     title="HR Interview AI API",
     description="API for AI-powered HR interview question generation",
     version="1.0.0",
+    # orjson serializes the large match/analysis payloads much faster
+    # than the stdlib json encoder
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Compress large JSON payloads (match results, debug dumps) for clients
+# that accept gzip; small responses are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -25,9 +64,14 @@ app.include_router(hybrid_search_router, prefix="/api/v1")
 app.include_router(interviews_router, prefix="/api/v1")
 
 
+# Root payload never changes, so encode it once at import time
+_ROOT_RESPONSE_BODY = json.dumps(
+    {"message": "HR Interview AI API is running"}).encode("utf-8")
+
+
 @app.get("/")
 async def root():
-    return {"message": "HR Interview AI API is running"}
+    return Response(content=_ROOT_RESPONSE_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
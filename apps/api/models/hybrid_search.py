@@ -54,3 +54,29 @@ class CandidateMatchResult(BaseModel):
     candidate_id: str
     scores: HybridScores  # Vector, BM25, and hybrid scores
     report: Optional[CandidateAnalysisReport] = None  # AI-generated analysis report
+
+
+class JobDescriptionRequest(BaseModel):
+    """Request model for job description search."""
+    job_description: str = Field(...,
+                                 description="Job description text to search against")
+    k: int = Field(default=5, ge=1, le=20,
+                   description="Number of results to return")
+    search_type: str = Field(
+        default="hybrid", description="Search type: hybrid, vector, or keyword")
+    job_description_id: Optional[str] = Field(
+        default=None, description="Optional Convex job description ID to save results")
+
+
+class CandidateMatchResponse(BaseModel):
+    """Response model for candidate match results."""
+    results: List[CandidateMatchResult]
+    query: str
+    total_candidates: int
+
+
+class SanitizedResumeResponse(BaseModel):
+    """Response model for sanitized resume."""
+    candidate_id: str
+    sanitized_content: str
+    filename: Optional[str] = None
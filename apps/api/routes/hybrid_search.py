@@ -1,40 +1,128 @@
 """
 API routes for hybrid search functionality.
 """
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from typing import List, Optional
-from pydantic import BaseModel, Field
-
-from services.hybrid_search_service import HybridSearchService, process_resume, find_matches
-from models.hybrid_search import SearchResult, CandidateMatchResult
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, Form, HTTPException, Response
+from typing import Dict, List, Optional, Tuple
+
+from services.convex_client import ConvexClient
+from services.hybrid_search_service import HybridSearchService
+from models.hybrid_search import (
+    JobDescriptionRequest,
+    CandidateMatchResponse,
+    SanitizedResumeResponse,
+)
 
 router = APIRouter(prefix="/hybrid-search", tags=["hybrid-search"])
 
+logger = logging.getLogger(__name__)
+
+# Accepted resume file extensions; frozenset gives O(1) membership checks
+ALLOWED_RESUME_EXTENSIONS = frozenset({".pdf", ".docx", ".doc"})
+
+# Content types matching the allowed extensions. Some clients send
+# application/octet-stream for any binary upload, so accept that too and
+# let the extension check plus the document loader reject bad content.
+ALLOWED_RESUME_CONTENT_TYPES = frozenset({
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/msword",
+    "application/octet-stream",
+})
+
+# Ceiling on resume upload size; bounds worst-case tmp-disk and
+# embedding cost for a single request
+MAX_RESUME_UPLOAD_BYTES = 25 * 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def get_search_service() -> HybridSearchService:
+    """
+    Build the shared HybridSearchService once and reuse it across requests.
+
+    Instantiating the service re-initializes the embedding model, ChromaDB
+    client and BM25 state, which is far too expensive to do per request.
+    """
+    service = HybridSearchService()
+    service.load_existing_index()
+    return service
+
+
+@lru_cache(maxsize=1)
+def get_convex_client() -> ConvexClient:
+    """Build the shared ConvexClient once and reuse it across requests."""
+    return ConvexClient()
 
-class JobDescriptionRequest(BaseModel):
-    """Request model for job description search."""
-    job_description: str = Field(...,
-                                 description="Job description text to search against")
-    k: int = Field(default=5, ge=1, le=20,
-                   description="Number of results to return")
-    search_type: str = Field(
-        default="hybrid", description="Search type: hybrid, vector, or keyword")
-    job_description_id: Optional[str] = Field(
-        default=None, description="Optional Convex job description ID to save results")
 
+# In-flight find-matches tasks keyed by (job_description, k) so concurrent
+# identical queries share a single retrieval instead of each hitting the index
+_inflight_matches: Dict[Tuple[str, int], "asyncio.Task"] = {}
 
-class CandidateMatchResponse(BaseModel):
-    """Response model for candidate match results."""
-    results: List[CandidateMatchResult]
-    query: str
-    total_candidates: int
+# Exact-match result cache for find-matches. Entries expire after the TTL
+# and the whole cache is dropped whenever the index changes, so repeated
+# identical queries skip retrieval and AI evaluation without serving
+# results for resumes that were added or removed in between.
+_MATCHES_CACHE_TTL_SECONDS = 300.0
+_MATCHES_CACHE_MAX_ENTRIES = 128
+_matches_cache: "OrderedDict[Tuple[str, int], Tuple[float, List]]" = OrderedDict()
 
 
-class SanitizedResumeResponse(BaseModel):
-    """Response model for sanitized resume."""
-    candidate_id: str
-    sanitized_content: str
-    filename: Optional[str] = None
+def _matches_cache_get(key: Tuple[str, int]) -> Optional[List]:
+    """Return cached results for the key, or None if absent/expired."""
+    entry = _matches_cache.get(key)
+    if entry is None:
+        return None
+    cached_at, results = entry
+    if time.monotonic() - cached_at > _MATCHES_CACHE_TTL_SECONDS:
+        _matches_cache.pop(key, None)
+        return None
+    _matches_cache.move_to_end(key)
+    return results
+
+
+def _matches_cache_put(key: Tuple[str, int], results: List) -> None:
+    """Store results for the key, evicting the oldest entries beyond the cap."""
+    _matches_cache[key] = (time.monotonic(), results)
+    _matches_cache.move_to_end(key)
+    while len(_matches_cache) > _MATCHES_CACHE_MAX_ENTRIES:
+        _matches_cache.popitem(last=False)
+
+
+def _invalidate_matches_cache() -> None:
+    """Drop all cached find-matches results after the index changes."""
+    _matches_cache.clear()
+
+
+async def _find_matches_shared(
+    service: HybridSearchService,
+    job_description: str,
+    k: int
+) -> List:
+    """
+    Run find_matches, batching concurrent identical requests onto one task.
+
+    The vector + BM25 retrieval and AI evaluation dominate request latency,
+    so duplicated concurrent queries (e.g. a recruiter double-submitting or
+    several tabs polling) should not multiply that work.
+    """
+    key = (job_description, k)
+    task = _inflight_matches.get(key)
+    if task is None:
+        task = asyncio.create_task(
+            service.find_matches(job_description=job_description, k=k)
+        )
+        _inflight_matches[key] = task
+        task.add_done_callback(lambda _: _inflight_matches.pop(key, None))
+    return await task
 
 
 @router.post("/process-resume", summary="Process a resume file")
@@ -55,56 +143,116 @@ async def process_resume_file(
     Returns:
         Success message with document count and sanitized content
     """
-    try:
-        # Save uploaded file temporarily
-        import tempfile
-        import os
-
-        file_extension = os.path.splitext(file.filename)[1].lower()
-        if file_extension not in [".pdf", ".docx", ".doc"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Unsupported file format. Please upload PDF or DOCX file."
-            )
+    # Reject bad uploads from the headers alone, before buffering any of
+    # the request body. These run outside the handler's try block so the
+    # 400s reach the client instead of being re-wrapped as 500s.
+    file_extension = os.path.splitext(file.filename)[1].lower()
+    if file_extension not in ALLOWED_RESUME_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail="Unsupported file format. Please upload PDF or DOCX file."
+        )
+    if file.content_type and file.content_type not in ALLOWED_RESUME_CONTENT_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail="Unsupported content type. Please upload PDF or DOCX file."
+        )
+    if file.size is not None and file.size > MAX_RESUME_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail="Resume file too large. Maximum size is 25 MB."
+        )
 
+    try:
+        # Stream the upload to disk in chunks instead of buffering the
+        # whole file in memory, hashing the content along the way. The
+        # size is re-checked while streaming since headers can lie.
+        hasher = hashlib.sha256()
+        bytes_written = 0
         with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
             tmp_path = tmp_file.name
+            while chunk := await file.read(1024 * 1024):
+                bytes_written += len(chunk)
+                if bytes_written > MAX_RESUME_UPLOAD_BYTES:
+                    await asyncio.to_thread(os.unlink, tmp_path)
+                    raise HTTPException(
+                        status_code=413,
+                        detail="Resume file too large. Maximum size is 25 MB."
+                    )
+                hasher.update(chunk)
+                tmp_file.write(chunk)
+        content_hash = hasher.hexdigest()
 
         try:
+            service = get_search_service()
+
+            # Short-circuit: if this exact content is already indexed for
+            # this candidate, skip the sanitize/chunk/embed pipeline and
+            # return the stored chunks
+            if service.ensure_index_loaded() and service.hybrid_matcher.vector_store:
+                collection = service.hybrid_matcher.vector_store._collection
+                if collection:
+                    duplicate_filter = {"content_hash": content_hash}
+                    if candidate_id:
+                        duplicate_filter = {"$and": [
+                            {"content_hash": content_hash},
+                            {"candidate_id": str(candidate_id)},
+                        ]}
+                    existing = collection.get(
+                        where=duplicate_filter,
+                        include=["documents"]
+                    )
+                    existing_docs = (existing.get('documents')
+                                     or []) if existing else []
+                    if existing_docs:
+                        return {
+                            "message": "Resume already processed (duplicate content)",
+                            "document_count": len(existing_docs),
+                            "filename": file.filename,
+                            "sanitized_content": "\n\n".join(existing_docs),
+                            "candidate_id": candidate_id
+                        }
+
             # Process resume
-            metadata = {}
+            metadata = {"content_hash": content_hash}
             if candidate_id:
                 metadata["candidate_id"] = candidate_id
             if file.filename:
                 metadata["original_filename"] = file.filename
 
-            service = HybridSearchService()
             documents = await service.process_resume(tmp_path, metadata)
 
-            # Get sanitized content from documents
+            # Get sanitized content from documents without building an
+            # intermediate list of the (potentially large) page contents
             sanitized_content = "\n\n".join(
-                [doc.page_content for doc in documents])
+                doc.page_content for doc in documents)
 
-            # Debug: Verify metadata was preserved in chunks
-            if candidate_id:
-                # Check if chunks have the metadata
+            # Verify metadata was preserved in chunks. The extra Chroma fetch
+            # and formatting only run when debug logging is enabled, so the
+            # hot path does no diagnostic I/O in production.
+            if candidate_id and logger.isEnabledFor(logging.DEBUG):
                 if service.hybrid_matcher.vector_store:
                     try:
                         collection = service.hybrid_matcher.vector_store._collection
                         if collection:
                             # Get a sample to verify metadata
-                            sample_results = collection.get(limit=1)
-                            if sample_results and 'metadatas' in sample_results and len(sample_results['metadatas']) > 0:
-                                sample_metadata = sample_results['metadatas'][0]
-                                print(
-                                    f"DEBUG: Sample chunk metadata after indexing: {sample_metadata}")
+                            sample_results = collection.get(
+                                limit=1, include=["metadatas"])
+                            sample_metadatas = sample_results.get(
+                                'metadatas') if sample_results else None
+                            if sample_metadatas:
+                                sample_metadata = sample_metadatas[0]
+                                logger.debug(
+                                    "Sample chunk metadata after indexing: %s",
+                                    sample_metadata)
                                 if 'candidate_id' not in sample_metadata:
-                                    print(
-                                        f"WARNING: candidate_id not found in chunk metadata!")
+                                    logger.warning(
+                                        "candidate_id not found in chunk metadata!")
                     except Exception as e:
-                        print(f"DEBUG: Error checking metadata: {e}")
+                        logger.debug("Error checking metadata: %s", e)
+
+            # The index changed, so cached match results are stale
+            _invalidate_matches_cache()
 
             return {
                 "message": "Resume processed successfully",
@@ -114,10 +262,15 @@ async def process_resume_file(
                 "candidate_id": candidate_id
             }
         finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            # Clean up the temporary file off the event loop; tolerating a
+            # missing file avoids racing an exists() check against unlink()
+            try:
+                await asyncio.to_thread(os.unlink, tmp_path)
+            except FileNotFoundError:
+                pass
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error processing resume: {str(e)}")
@@ -144,10 +297,10 @@ async def get_sanitized_resume(candidate_id: str):
         Sanitized resume content
     """
     try:
-        service = HybridSearchService()
+        service = get_search_service()
 
         # Load existing index
-        if not service.load_existing_index():
+        if not service.ensure_index_loaded():
             raise HTTPException(
                 status_code=404,
                 detail="No indexed resumes found. Please ensure resumes have been uploaded."
@@ -168,40 +321,52 @@ async def get_sanitized_resume(candidate_id: str):
                 detail="No indexed resumes found."
             )
 
-        # Get all documents and filter by candidate_id
-        # ChromaDB where filter may not work for all cases, so get all and filter
-        results = collection.get()
-
-        if not results or 'documents' not in results or len(results['documents']) == 0:
-            raise HTTPException(
-                status_code=404,
-                detail="No indexed resumes found. Please ensure resumes have been uploaded."
-            )
-
-        # Debug: Collect all candidate_ids for error message
-        all_candidate_ids = set()
-        for metadata in results.get('metadatas', []):
-            if metadata and 'candidate_id' in metadata:
-                all_candidate_ids.add(str(metadata.get('candidate_id')))
-
-        # Find documents with matching candidate_id
+        # Collect matching documents
         sanitized_parts = []
         filename = None
 
-        for i, doc_text in enumerate(results['documents']):
-            metadata = results.get('metadatas', [{}])[
-                i] if results.get('metadatas') else {}
-            # Check if candidate_id matches (handle both string and any other format)
-            candidate_id_in_metadata = metadata.get('candidate_id')
-            if candidate_id_in_metadata and str(candidate_id_in_metadata) == str(candidate_id):
-                sanitized_parts.append(doc_text)
-                if not filename and metadata.get('original_filename'):
-                    filename = metadata.get('original_filename')
+        # Fast path: the matcher keeps a precomputed candidate -> chunks map
+        candidate_docs = service.hybrid_matcher.get_candidate_documents(
+            candidate_id)
+        if candidate_docs:
+            for doc in candidate_docs:
+                sanitized_parts.append(doc.page_content)
+                if not filename and doc.metadata.get('original_filename'):
+                    filename = doc.metadata.get('original_filename')
+        else:
+            # Let ChromaDB filter by candidate_id instead of scanning the whole index
+            results = collection.get(
+                where={"candidate_id": str(candidate_id)},
+                include=["documents", "metadatas"]
+            )
+
+            if results and results.get('documents'):
+                for i, doc_text in enumerate(results['documents']):
+                    metadata = results.get('metadatas', [{}])[
+                        i] if results.get('metadatas') else {}
+                    sanitized_parts.append(doc_text)
+                    if not filename and metadata.get('original_filename'):
+                        filename = metadata.get('original_filename')
 
         if not sanitized_parts:
-            # Provide helpful error message with available IDs
-            available_ids = ", ".join(list(all_candidate_ids)[
-                                      :10]) if all_candidate_ids else "none"
+            # Diagnostic path only: fetch metadata to list available IDs.
+            # Stop as soon as 10 distinct IDs are collected rather than
+            # deduplicating the whole index and truncating afterwards.
+            all_candidate_ids = set()
+            all_results = collection.get(include=["metadatas"])
+            for metadata in (all_results.get('metadatas') or []) if all_results else []:
+                if metadata and 'candidate_id' in metadata:
+                    all_candidate_ids.add(str(metadata.get('candidate_id')))
+                    if len(all_candidate_ids) >= 10:
+                        break
+
+            if not all_candidate_ids:
+                raise HTTPException(
+                    status_code=404,
+                    detail="No indexed resumes found. Please ensure resumes have been uploaded."
+                )
+
+            available_ids = ", ".join(all_candidate_ids)
             raise HTTPException(
                 status_code=404,
                 detail=f"No resume found for candidate {candidate_id}. Available candidate IDs in index: {available_ids}"
@@ -209,7 +374,8 @@ async def get_sanitized_resume(candidate_id: str):
 
         sanitized_content = "\n\n".join(sanitized_parts)
 
-        return SanitizedResumeResponse(
+        # Data is produced internally, so skip re-validation on serialization
+        return SanitizedResumeResponse.model_construct(
             candidate_id=candidate_id,
             sanitized_content=sanitized_content,
             filename=filename
@@ -236,10 +402,10 @@ async def delete_resume(candidate_id: str):
         Success message with count of deleted documents
     """
     try:
-        service = HybridSearchService()
+        service = get_search_service()
 
         # Load existing index
-        if not service.load_existing_index():
+        if not service.ensure_index_loaded():
             raise HTTPException(
                 status_code=404,
                 detail="No indexed resumes found."
@@ -258,22 +424,13 @@ async def delete_resume(candidate_id: str):
                 detail="No indexed resumes found."
             )
 
-        # Get all documents to find matching candidate_id
-        results = collection.get()
-
-        if not results or 'documents' not in results or len(results['documents']) == 0:
-            raise HTTPException(
-                status_code=404,
-                detail="No indexed resumes found."
-            )
-
-        # Find all document IDs that match this candidate_id
-        ids_to_delete = []
-        for i, metadata in enumerate(results.get('metadatas', [])):
-            if metadata and metadata.get('candidate_id') == candidate_id:
-                # Get the ID for this document
-                if 'ids' in results and i < len(results['ids']):
-                    ids_to_delete.append(results['ids'][i])
+        # Let Chroma return only this candidate's rows (ids come back by
+        # default) instead of materializing and scanning the whole index
+        results = collection.get(
+            where={"candidate_id": str(candidate_id)},
+            include=[]
+        )
+        ids_to_delete = (results.get('ids') or []) if results else []
 
         if not ids_to_delete:
             raise HTTPException(
@@ -284,46 +441,12 @@ async def delete_resume(candidate_id: str):
         # Delete documents by IDs
         collection.delete(ids=ids_to_delete)
 
-        # Rebuild the retrievers after deletion
-        # Get remaining documents
-        remaining_results = collection.get()
-        if remaining_results and 'documents' in remaining_results and len(remaining_results['documents']) > 0:
-            # Recreate documents list for BM25
-            remaining_documents = []
-            for i, doc_text in enumerate(remaining_results['documents']):
-                metadata = remaining_results.get('metadatas', [{}])[
-                    i] if remaining_results.get('metadatas') else {}
-                from langchain_core.documents import Document
-                remaining_documents.append(
-                    Document(page_content=doc_text, metadata=metadata)
-                )
-
-            # Recreate BM25 retriever
-            from langchain_community.retrievers import BM25Retriever
-            service.hybrid_matcher.bm25_retriever = BM25Retriever.from_documents(
-                remaining_documents)
-            service.hybrid_matcher.bm25_retriever.k = 10
-
-            # Recreate ensemble retriever
-            vector_retriever = service.hybrid_matcher.vector_store.as_retriever(
-                search_type="similarity",
-                search_kwargs={"k": 10}
-            )
-            from langchain.retrievers import EnsembleRetriever
-            service.hybrid_matcher.ensemble_retriever = EnsembleRetriever(
-                retrievers=[vector_retriever,
-                            service.hybrid_matcher.bm25_retriever],
-                weights=[service.hybrid_matcher.vector_weight,
-                         service.hybrid_matcher.bm25_weight]
-            )
+        # Rebuild the retrievers from the in-memory documents that remain,
+        # instead of re-fetching the whole collection from Chroma
+        service.hybrid_matcher.remove_candidate(candidate_id)
 
-            # Update documents list
-            service.hybrid_matcher.documents = remaining_documents
-        else:
-            # No documents left, reset retrievers
-            service.hybrid_matcher.bm25_retriever = None
-            service.hybrid_matcher.ensemble_retriever = None
-            service.hybrid_matcher.documents = []
+        # The index changed, so cached match results are stale
+        _invalidate_matches_cache()
 
         return {
             "message": "Resume deleted successfully",
@@ -340,8 +463,51 @@ async def delete_resume(candidate_id: str):
         )
 
 
+async def _save_evaluation_to_convex(
+    job_description_id: str,
+    job_description: str,
+    results: List
+) -> None:
+    """Persist find-matches results to Convex; failures are logged, not raised."""
+    try:
+        convex_client = get_convex_client()
+
+        # Convert results to dict format for Convex
+        results_dict = [
+            {
+                "candidate_id": r.candidate_id,
+                "scores": {
+                    "vector_score": r.scores.vector_score,
+                    "bm25_score": r.scores.bm25_score,
+                    "hybrid_score": r.scores.hybrid_score,
+                },
+                "report": {
+                    "fit_category": r.report.fit_category,
+                    "overall_score": r.report.overall_score,
+                    "missing_skills": r.report.missing_skills,
+                    "explanation": r.report.explanation,
+                    "strengths": r.report.strengths,
+                    "weaknesses": r.report.weaknesses,
+                } if r.report else None
+            }
+            for r in results
+        ]
+
+        await convex_client.save_resume_evaluation(
+            job_description_id=job_description_id,
+            job_description_text=job_description,
+            results=results_dict,
+            total_candidates=len(results)
+        )
+    except Exception as save_error:
+        logger.warning(
+            f"Failed to save resume evaluation to Convex: {save_error}. "
+            "Results are still returned, but not persisted."
+        )
+
+
 @router.post("/find-matches", response_model=CandidateMatchResponse, summary="Find matching candidates")
-async def find_matching_candidates(request: JobDescriptionRequest):
+async def find_matching_candidates(request: JobDescriptionRequest, background_tasks: BackgroundTasks):
     """
     Find matching candidates for a job description using AI-powered evaluation.
     Returns one result per candidate with three evaluation scores.
@@ -355,54 +521,35 @@ async def find_matching_candidates(request: JobDescriptionRequest):
         List of CandidateMatchResult objects - one per candidate with three AI evaluation scores
     """
     try:
-        results = await find_matches(
-            job_description=request.job_description,
-            k=request.k
-        )
+        service = get_search_service()
 
-        # Save results to Convex if job_description_id is provided
-        if request.job_description_id:
-            try:
-                from services.convex_client import ConvexClient
-                convex_client = ConvexClient()
-
-                # Convert results to dict format for Convex
-                results_dict = [
-                    {
-                        "candidate_id": r.candidate_id,
-                        "scores": {
-                            "vector_score": r.scores.vector_score,
-                            "bm25_score": r.scores.bm25_score,
-                            "hybrid_score": r.scores.hybrid_score,
-                        },
-                        "report": {
-                            "fit_category": r.report.fit_category,
-                            "overall_score": r.report.overall_score,
-                            "missing_skills": r.report.missing_skills,
-                            "explanation": r.report.explanation,
-                            "strengths": r.report.strengths,
-                            "weaknesses": r.report.weaknesses,
-                        } if r.report else None
-                    }
-                    for r in results
-                ]
-
-                await convex_client.save_resume_evaluation(
-                    job_description_id=request.job_description_id,
-                    job_description_text=request.job_description,
-                    results=results_dict,
-                    total_candidates=len(results)
-                )
-            except Exception as save_error:
-                # Log error but don't fail the request
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(
-                    f"Failed to save resume evaluation to Convex: {save_error}. "
-                    "Results are still returned, but not persisted."
+        if not service.ensure_index_loaded():
+            # If no index exists, return empty results
+            results = []
+        else:
+            cache_key = (request.job_description, request.k)
+            results = _matches_cache_get(cache_key)
+            if results is None:
+                results = await _find_matches_shared(
+                    service,
+                    job_description=request.job_description,
+                    k=request.k
                 )
+                _matches_cache_put(cache_key, results)
+
+        # Persist to Convex after the response is sent; the client does not
+        # need to wait on the mutation round-trip
+        if request.job_description_id:
+            background_tasks.add_task(
+                _save_evaluation_to_convex,
+                request.job_description_id,
+                request.job_description,
+                results
+            )
 
-        return CandidateMatchResponse(
+        # Results are already validated CandidateMatchResult objects,
+        # so skip re-validation on the trusted internal path
+        return CandidateMatchResponse.model_construct(
             results=results,
             query=request.job_description,
             total_candidates=len(results)
@@ -419,9 +566,9 @@ async def find_matching_candidates(request: JobDescriptionRequest):
 async def debug_get_candidate_ids():
     """Debug endpoint to see all candidate IDs in the index."""
     try:
-        service = HybridSearchService()
+        service = get_search_service()
 
-        if not service.load_existing_index():
+        if not service.ensure_index_loaded():
             return {
                 "message": "No index found",
                 "candidate_ids": []
@@ -440,24 +587,25 @@ async def debug_get_candidate_ids():
                 "candidate_ids": []
             }
 
-        results = collection.get()
-        candidate_ids = set()
-        candidate_metadata = []
+        # Fetch metadata only (skips documents and embeddings) and filter
+        # with comprehensions instead of a per-record Python loop
+        results = collection.get(include=["metadatas"])
+        metadatas = (results.get('metadatas') or []) if results else []
 
-        if results and 'metadatas' in results:
-            for i, metadata in enumerate(results.get('metadatas', [])):
-                if metadata and 'candidate_id' in metadata:
-                    candidate_id = str(metadata.get('candidate_id'))
-                    candidate_ids.add(candidate_id)
-                    candidate_metadata.append({
-                        "candidate_id": candidate_id,
-                        "filename": metadata.get('original_filename'),
-                        "source_type": metadata.get('source_type'),
-                    })
+        candidate_metadata = [
+            {
+                "candidate_id": str(metadata['candidate_id']),
+                "filename": metadata.get('original_filename'),
+                "source_type": metadata.get('source_type'),
+            }
+            for metadata in metadatas
+            if metadata and 'candidate_id' in metadata
+        ]
+        candidate_ids = {entry["candidate_id"] for entry in candidate_metadata}
 
         return {
             "message": "Found candidate IDs",
-            "total_documents": len(results.get('documents', [])) if results else 0,
+            "total_documents": len(metadatas),
             "unique_candidate_ids": list(candidate_ids),
             "candidate_metadata": candidate_metadata
         }
@@ -469,11 +617,18 @@ async def debug_get_candidate_ids():
         }
 
 
+# Health payload never changes, so encode it once at import time
+_HEALTH_RESPONSE_BODY = json.dumps({
+    "status": "healthy",
+    "service": "hybrid-search",
+    "message": "Hybrid search service is operational"
+}).encode("utf-8")
+
+
 @router.get("/health", summary="Health check for hybrid search service")
 async def health_check():
     """Check if hybrid search service is operational."""
-    return {
-        "status": "healthy",
-        "service": "hybrid-search",
-        "message": "Hybrid search service is operational"
-    }
+    return Response(
+        content=_HEALTH_RESPONSE_BODY,
+        media_type="application/json"
+    )
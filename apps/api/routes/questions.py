@@ -1,13 +1,33 @@
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Tuple
+
 from fastapi import APIRouter, Depends, HTTPException
 from models.question import JobDescription, QuestionResponse
 from services.question_generator import generate_interview_questions
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/questions",
     tags=["questions"],
     responses={404: {"description": "Not found"}},
 )
 
+# LRU cache of generated questions keyed by (job_title, sha256(description),
+# temperature). Recruiters re-submit the same JD often; repeat hits skip the
+# LLM pipeline entirely. regenerate=True bypasses the lookup (but refreshes
+# the entry) since varied output is the point of that flag.
+_QUESTIONS_CACHE_MAX_ENTRIES = 256
+_questions_cache: "OrderedDict[Tuple[str, str, float], tuple]" = OrderedDict()
+
+
+def _questions_cache_key(title: str, description: str, temperature: float) -> Tuple[str, str, float]:
+    """Build a bounded-size cache key; the JD is hashed, not stored raw."""
+    description_hash = hashlib.sha256(description.encode("utf-8")).hexdigest()
+    return (title, description_hash, temperature)
+
 
 @router.post("/generate", response_model=QuestionResponse)
 async def generate_questions(job_description: JobDescription):
@@ -24,17 +44,27 @@ async def generate_questions(job_description: JobDescription):
         temperature = getattr(job_description, 'temperature', 0.7)
         regenerate = getattr(job_description, 'regenerate', False)
 
-        questions, context_analysis = await generate_interview_questions(
-            job_title=job_description.title,
-            job_description=job_description.description,
-            temperature=temperature,
-            regenerate=regenerate
-        )
+        cache_key = _questions_cache_key(
+            job_description.title, job_description.description, temperature)
+        if not regenerate and cache_key in _questions_cache:
+            _questions_cache.move_to_end(cache_key)
+            questions, context_analysis = _questions_cache[cache_key]
+        else:
+            questions, context_analysis = await generate_interview_questions(
+                job_title=job_description.title,
+                job_description=job_description.description,
+                temperature=temperature,
+                regenerate=regenerate
+            )
+            _questions_cache[cache_key] = (questions, context_analysis)
+            _questions_cache.move_to_end(cache_key)
+            while len(_questions_cache) > _QUESTIONS_CACHE_MAX_ENTRIES:
+                _questions_cache.popitem(last=False)
 
         return QuestionResponse(
             questions=questions,
             context_analysis=context_analysis
         )
     except Exception as e:
-        print(f"Error generating questions: {str(e)}")
+        logger.error("Error generating questions: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
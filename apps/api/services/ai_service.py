@@ -2,10 +2,28 @@
 Legacy AI service - kept for backward compatibility.
 New implementation is in question_generator.py
 """
-from typing import List
+import hashlib
+import time
+from collections import OrderedDict
+from typing import List, Tuple
+
 from models.question import Question
 from services.question_generator import generate_interview_questions as generate_questions_advanced
 
+# Content-addressable cache of generated questions. Recruiters reuse the
+# same job posting across sessions, so repeat calls should not pay the
+# multi-second Gemini round-trip again. Keys are SHA-256 digests of the
+# normalized inputs; entries expire after a day.
+_CACHE_TTL_SECONDS = 86400.0
+_CACHE_MAX_ENTRIES = 256
+_questions_cache: "OrderedDict[str, Tuple[float, List[Question]]]" = OrderedDict()
+
+
+def _cache_key(job_title: str, job_description: str, strictness: float) -> str:
+    """Build a bounded-size cache key from the generation inputs."""
+    raw = f"{job_title.strip()}|{job_description.strip()}|{strictness}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
 
 async def generate_interview_questions(
     job_title: str,
@@ -16,17 +34,38 @@ async def generate_interview_questions(
     Generate interview questions using advanced pipeline.
     This is a wrapper for backward compatibility.
 
+    Repeat calls with the same inputs are served from an in-process cache
+    instead of re-running the Gemini pipeline.
+
     Args:
         job_title: The title of the job
         job_description: The description of the job
-        strictness: Domain adaptation parameter (0.0-1.0)
+        strictness: Domain adaptation parameter (0.0-1.0), passed through
+            as the model temperature
 
     Returns:
         List of Question objects
     """
+    key = _cache_key(job_title, job_description, strictness)
+    now = time.monotonic()
+
+    entry = _questions_cache.get(key)
+    if entry is not None:
+        cached_at, questions = entry
+        if now - cached_at <= _CACHE_TTL_SECONDS:
+            _questions_cache.move_to_end(key)
+            return questions
+        del _questions_cache[key]
+
     questions, _ = await generate_questions_advanced(
         job_title=job_title,
         job_description=job_description,
-        strictness=strictness
+        temperature=strictness
     )
+
+    _questions_cache[key] = (now, questions)
+    _questions_cache.move_to_end(key)
+    while len(_questions_cache) > _CACHE_MAX_ENTRIES:
+        _questions_cache.popitem(last=False)
+
     return questions
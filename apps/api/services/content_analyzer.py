@@ -3,31 +3,118 @@ Content Validity Analysis Service (S_content).
 Uses Google Gemini to evaluate answer validity against expected keywords.
 """
 import os
-import json
 import asyncio
 import logging
+import re
+
+# Rust-backed parser; the batched judge responses run to several KB of
+# nested JSON where orjson is a few times faster than the stdlib
+import orjson
+from google.genai import types
+from pydantic import BaseModel
 from typing import Dict, Any, List, Optional
-from google import genai
 from dotenv import load_dotenv
 
+from services.gemini_client import get_client
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 
+class _Verdict(BaseModel):
+    """Structured-output schema for a single judge verdict."""
+    score: float
+    reasoning: str
+    keywords_found: List[str]
+    keywords_missing: List[str]
+
+
+class _BatchVerdict(_Verdict):
+    """Verdict carrying the answer index it refers to."""
+    id: int
+
+
+class _BatchVerdicts(BaseModel):
+    """Structured-output schema for the batched judge response."""
+    results: List[_BatchVerdict]
+
+
 class ContentAnalyzerAgent:
     """
     AI Agent for analyzing content validity of interview answers.
     Acts as a "Judge" to evaluate if answers contain expected keywords and relevant content.
+
+    Set CONTENT_JUDGE_MODE=local to score with a local sentence-transformers
+    model (sub-10ms on CPU, no API quota) instead of Gemini; the LLM judge
+    remains the default because its reasoning text is richer.
     """
 
+    # Shared across instances — the embedding model is ~80MB and loads once
+    _embedder = None
+
     def __init__(self):
         """Initialize the content analyzer agent."""
         self.model = 'gemini-2.0-flash-001'
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY environment variable is required")
-        self.client = genai.Client(api_key=api_key)
+        self.judge_mode = os.getenv("CONTENT_JUDGE_MODE", "llm").lower()
+        self.client = get_client()
+        # Keyword-embedding matrices are small and reused across answers to
+        # the same question, so keep a bounded per-instance cache
+        self._keyword_embedding_cache: Dict[tuple, Any] = {}
+
+    @classmethod
+    def _get_embedder(cls):
+        """Lazily load the shared sentence-transformers model."""
+        if cls._embedder is None:
+            from sentence_transformers import SentenceTransformer
+            cls._embedder = SentenceTransformer("all-MiniLM-L6-v2")
+        return cls._embedder
+
+    def _local_content_score(
+        self,
+        answer_text: str,
+        expected_keywords: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Score an answer locally via embedding similarity to the expected
+        keywords — no network call, suitable for high-volume scoring.
+        """
+        if not expected_keywords:
+            return self._get_fallback_score(answer_text, expected_keywords)
+
+        embedder = self._get_embedder()
+
+        cache_key = tuple(expected_keywords)
+        keyword_embeddings = self._keyword_embedding_cache.get(cache_key)
+        if keyword_embeddings is None:
+            keyword_embeddings = embedder.encode(
+                expected_keywords, normalize_embeddings=True)
+            if len(self._keyword_embedding_cache) >= 256:
+                self._keyword_embedding_cache.pop(
+                    next(iter(self._keyword_embedding_cache)))
+            self._keyword_embedding_cache[cache_key] = keyword_embeddings
+
+        answer_embedding = embedder.encode(
+            answer_text, normalize_embeddings=True)
+
+        # Cosine similarity of each keyword against the whole answer;
+        # 0.4+ on MiniLM indicates the concept is clearly present
+        similarities = keyword_embeddings @ answer_embedding
+        found = [kw for kw, sim in zip(expected_keywords, similarities)
+                 if sim >= 0.4]
+        missing = [kw for kw in expected_keywords if kw not in found]
+        score = max(0.0, min(1.0, float(similarities.mean()) + 0.25 *
+                             (len(found) / len(expected_keywords))))
+
+        return {
+            "score": round(score, 3),
+            "reasoning": (
+                f"Local embedding judge: {len(found)}/{len(expected_keywords)} "
+                f"expected concepts present in the answer"
+            ),
+            "keywords_found": found,
+            "keywords_missing": missing
+        }
 
     async def analyze_content_validity(
         self,
@@ -50,6 +137,10 @@ class ContentAnalyzerAgent:
             - keywords_found: List of expected keywords found in answer
             - keywords_missing: List of expected keywords not found
         """
+        if self.judge_mode == "local":
+            return await asyncio.to_thread(
+                self._local_content_score, answer_text, expected_keywords)
+
         try:
             # Build prompt for Gemini
             keywords_str = ", ".join(
@@ -88,51 +179,163 @@ Scoring Guidelines:
 
 Be strict but fair. Base your evaluation on actual content, not assumptions."""
 
-            # Call Gemini API asynchronously
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
+            # Constrained decoding: the model emits schema-conforming JSON
+            # and the SDK hands back a parsed Verdict, so there is no
+            # markdown-fence stripping to go wrong
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
-                contents=prompt
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    response_schema=_Verdict
+                )
             )
 
-            # Parse JSON response
-            response_text = response.text.strip()
-
-            # Try to extract JSON from response (might have markdown code blocks)
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-
-            # Parse JSON
-            try:
-                result = json.loads(response_text)
-
-                # Validate and normalize score
-                score = float(result.get("score", 0.0))
-                score = max(0.0, min(1.0, score))  # Clamp to [0.0, 1.0]
-
-                return {
-                    "score": score,
-                    "reasoning": result.get("reasoning", "No reasoning provided"),
-                    "keywords_found": result.get("keywords_found", []),
-                    "keywords_missing": result.get("keywords_missing", [])
-                }
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse Gemini response as JSON: {e}")
-                logger.debug(f"Response text: {response_text}")
-                # Fallback: try to extract score from text
-                return self._get_fallback_score(answer_text, expected_keywords)
+            verdict = response.parsed
+            if verdict is None:
+                verdict = _Verdict.model_validate(orjson.loads(response.text))
+
+            return {
+                "score": max(0.0, min(1.0, verdict.score)),
+                "reasoning": verdict.reasoning or "No reasoning provided",
+                "keywords_found": verdict.keywords_found,
+                "keywords_missing": verdict.keywords_missing
+            }
 
         except Exception as e:
             logger.error(
                 f"Error analyzing content validity: {e}", exc_info=True)
             return self._get_fallback_score(answer_text, expected_keywords)
 
+    async def analyze_content_validity_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze several answers in a single Gemini request.
+
+        One prompt carries all (question, keywords, answer) triples and asks
+        for a JSON array of verdicts, so a full interview costs one network
+        round-trip instead of one per answer and the judge instructions are
+        sent only once.
+
+        Args:
+            items: List of dictionaries, each with:
+                - answer_text: The candidate's answer text
+                - expected_keywords: List of expected keywords/concepts
+                - question_text: Optional question text for context
+
+        Returns:
+            List of result dictionaries (same shape as
+            analyze_content_validity), in the same order as items
+        """
+        if not items:
+            return []
+
+        if self.judge_mode == "local":
+            return await asyncio.to_thread(lambda: [
+                self._local_content_score(
+                    item["answer_text"], item.get("expected_keywords") or [])
+                for item in items
+            ])
+
+        try:
+            blocks = []
+            for i, item in enumerate(items):
+                keywords = item.get("expected_keywords") or []
+                keywords_str = ", ".join(keywords) if keywords else "N/A"
+                question_text = item.get("question_text")
+                question_context = f"\nQuestion: {question_text}" if question_text else ""
+
+                blocks.append(
+                    f"--- Answer {i} ---{question_context}\n"
+                    f"Expected Keywords/Concepts: {keywords_str}\n"
+                    f"Candidate's Answer:\n{item['answer_text']}"
+                )
+
+            answers_block = "\n\n".join(blocks)
+
+            prompt = f"""You are an expert HR analyst evaluating interview answers. Your role is to act as a "Judge" and assess whether each candidate answer demonstrates understanding and relevance.
+
+{answers_block}
+
+Evaluate each answer based on:
+1. **Keyword Presence**: Does the answer mention or demonstrate understanding of the expected keywords/concepts?
+2. **Relevance**: Is the answer relevant to the question asked?
+3. **Completeness**: Does the answer provide sufficient detail?
+4. **Accuracy**: Are the statements factually reasonable (if applicable)?
+
+Return ONLY a valid JSON object with this exact structure:
+{{
+    "results": [
+        {{
+            "id": <answer index, matching the "Answer N" headers>,
+            "score": <float between 0.0 and 1.0>,
+            "reasoning": "<brief explanation of the score, 2-3 sentences>",
+            "keywords_found": ["keyword1", "keyword2", ...],
+            "keywords_missing": ["keyword1", "keyword2", ...]
+        }},
+        ...
+    ]
+}}
+
+Include exactly one entry per answer, in the same order.
+
+Scoring Guidelines:
+- 0.9-1.0: Answer demonstrates excellent understanding, mentions most/all keywords, highly relevant
+- 0.7-0.89: Answer shows good understanding, mentions many keywords, mostly relevant
+- 0.5-0.69: Answer shows moderate understanding, mentions some keywords, somewhat relevant
+- 0.3-0.49: Answer shows limited understanding, mentions few keywords, partially relevant
+- 0.0-0.29: Answer shows poor understanding, mentions no/minimal keywords, not relevant
+
+Be strict but fair. Base your evaluation on actual content, not assumptions."""
+
+            response = await self.client.aio.models.generate_content(
+                model=self.model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    response_schema=_BatchVerdicts
+                )
+            )
+
+            parsed = response.parsed
+            if parsed is None:
+                parsed = _BatchVerdicts.model_validate(
+                    orjson.loads(response.text))
+
+            by_id = {verdict.id: verdict for verdict in parsed.results}
+
+            results = []
+            for i, item in enumerate(items):
+                verdict = by_id.get(i)
+                if verdict is None:
+                    # Model skipped this answer; score it locally
+                    results.append(self._get_fallback_score(
+                        item["answer_text"],
+                        item.get("expected_keywords") or []
+                    ))
+                    continue
+
+                results.append({
+                    "score": max(0.0, min(1.0, verdict.score)),
+                    "reasoning": verdict.reasoning or "No reasoning provided",
+                    "keywords_found": verdict.keywords_found,
+                    "keywords_missing": verdict.keywords_missing
+                })
+            return results
+
+        except Exception as e:
+            logger.error(
+                f"Error in batch content validity analysis: {e}", exc_info=True)
+            return [
+                self._get_fallback_score(
+                    item["answer_text"],
+                    item.get("expected_keywords") or []
+                )
+                for item in items
+            ]
+
     def _get_fallback_score(
         self,
         answer_text: str,
@@ -157,19 +360,24 @@ Be strict but fair. Base your evaluation on actual content, not assumptions."""
                 "keywords_missing": []
             }
 
+        # Lowercase each keyword once; keywords that are a single \w+ token
+        # use the token set (O(1) per lookup). Anything else — phrases, or
+        # symbol-bearing names like "C++" and ".NET" that tokenization would
+        # mangle — falls back to the substring check.
         answer_lower = answer_text.lower()
-        found_keywords = [
-            kw for kw in expected_keywords
-            if kw.lower() in answer_lower
-        ]
-        missing_keywords = [
-            kw for kw in expected_keywords
-            if kw.lower() not in answer_lower
-        ]
+        answer_tokens = set(re.findall(r"\w+", answer_lower))
+
+        found_keywords = []
+        missing_keywords = []
+        for kw in expected_keywords:
+            kw_lower = kw.lower()
+            present = (kw_lower in answer_tokens
+                       if re.fullmatch(r"\w+", kw_lower)
+                       else kw_lower in answer_lower)
+            (found_keywords if present else missing_keywords).append(kw)
 
         # Simple score based on keyword presence ratio
-        score = len(found_keywords) / \
-            len(expected_keywords) if expected_keywords else 0.0
+        score = len(found_keywords) / len(expected_keywords)
 
         return {
             "score": score,
@@ -5,9 +5,12 @@ Uses Convex HTTP API to store data from Python backend.
 import os
 import httpx
 import logging
+import orjson
 from typing import Dict, Any, Optional, List
 from dotenv import load_dotenv
 
+from services.http_retry import request_with_retry
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -48,21 +51,23 @@ class ConvexClient:
             True if successful, False otherwise
         """
         try:
-            # Format results for Convex mutation
+            # Format results for Convex mutation, reading each nested
+            # dict once per result instead of re-fetching it per field
             formatted_results = []
             for result in results:
+                scores = result.get("scores") or {}
                 formatted_result = {
                     "candidate_id": result.get("candidate_id", ""),
                     "scores": {
-                        "vector_score": result.get("scores", {}).get("vector_score", 0.0),
-                        "bm25_score": result.get("scores", {}).get("bm25_score", 0.0),
-                        "hybrid_score": result.get("scores", {}).get("hybrid_score", 0.0),
+                        "vector_score": scores.get("vector_score", 0.0),
+                        "bm25_score": scores.get("bm25_score", 0.0),
+                        "hybrid_score": scores.get("hybrid_score", 0.0),
                     }
                 }
 
                 # Add report if present
-                if result.get("report"):
-                    report = result["report"]
+                report = result.get("report")
+                if report:
                     formatted_result["report"] = {
                         "fit_category": report.get("fit_category", ""),
                         "overall_score": report.get("overall_score", 0),
@@ -86,25 +91,28 @@ class ConvexClient:
                 "totalCandidates": total_candidates,
             }
 
-            # Call Convex HTTP API
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    mutation_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
+            # Call Convex HTTP API through the shared pooled client,
+            # retrying transient 429/5xx responses with backoff.
+            # orjson encodes the large nested results payload much faster
+            # than the stdlib encoder httpx would use for json=
+            response = await request_with_retry(
+                "POST",
+                mutation_url,
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+            )
 
-                if response.status_code == 200:
-                    logger.info(
-                        f"Successfully saved resume evaluation for job_description_id={job_description_id}"
-                    )
-                    return True
-                else:
-                    logger.error(
-                        f"Failed to save resume evaluation: HTTP {response.status_code}, "
-                        f"response: {response.text}"
-                    )
-                    return False
+            if response.status_code == 200:
+                logger.info(
+                    f"Successfully saved resume evaluation for job_description_id={job_description_id}"
+                )
+                return True
+            else:
+                logger.error(
+                    f"Failed to save resume evaluation: HTTP {response.status_code}, "
+                    f"response: {response.text}"
+                )
+                return False
 
         except Exception as e:
             logger.error(
@@ -1,10 +1,113 @@
+import asyncio
+import io
 import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import pdfplumber
 from docx import Document as DocxDocument
+from docx.oxml.ns import qn
 from langchain_core.documents import Document
 
+# Documents with at least this many pages are extracted page-parallel in
+# worker processes; below it the process round-trips cost more than the
+# sequential parse of a typical resume
+_PDF_PARALLEL_PAGE_THRESHOLD = 4
+
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pdf_executor() -> ProcessPoolExecutor:
+    """Lazily create the shared page-extraction process pool."""
+    global _pdf_executor
+    if _pdf_executor is None:
+        _pdf_executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _pdf_executor
+
+
+def _extract_page_text(file_path: str, page_num: int) -> str:
+    """
+    Extract text from a single PDF page (runs in a worker process).
+
+    Reopening the file per worker is cheap compared to pickling pdfplumber
+    page objects across the process boundary.
+    """
+    with pdfplumber.open(file_path) as pdf:
+        page = pdf.pages[page_num]
+
+        # Method 1: Standard text extraction
+        page_text = page.extract_text()
+
+        # Method 2: If standard extraction is poor, try extracting from
+        # words — but only on pages that carry text at all. extract_words
+        # runs full layout analysis, and on scanned/image-only pages
+        # (fewer than a handful of chars) it can only come up empty too.
+        if (not page_text or len(page_text.strip()) < 50) and len(page.chars) >= 5:
+            words = page.extract_words()
+            if words:
+                page_text = ' '.join(
+                    [word.get('text', '') for word in words if word.get('text')])
+
+        return page_text or ""
+
+
+def _extract_pdf_sequential(file_path: str) -> str:
+    """
+    Extract text from every page in one pass (runs off the event loop).
+
+    Page text streams into a single buffer and each page's layout cache is
+    released as soon as it has been read, so peak memory stays at one page
+    instead of the whole document plus a joined copy.
+    """
+    buf = io.StringIO()
+    with pdfplumber.open(file_path) as pdf:
+        for page_num in range(len(pdf.pages)):
+            page = pdf.pages[page_num]
+
+            page_text = page.extract_text()
+            # Skip the extract_words fallback on image-only pages — see
+            # _extract_page_text
+            if (not page_text or len(page_text.strip()) < 50) and len(page.chars) >= 5:
+                words = page.extract_words()
+                if words:
+                    page_text = ' '.join(
+                        [word.get('text', '') for word in words if word.get('text')])
+
+            if page_text and page_text.strip():
+                if buf.tell():
+                    buf.write("\n\n")
+                buf.write(page_text)
+
+            # Drop the parsed layout tree for this page before moving on
+            page.flush_cache()
+    return buf.getvalue()
+
+
+def _count_pdf_pages(file_path: str) -> int:
+    """Return the page count without extracting any text."""
+    with pdfplumber.open(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def _extract_docx_text(file_path: str) -> str:
+    """
+    Extract paragraph text from a DOCX file (runs off the event loop).
+
+    Walks the underlying lxml tree directly instead of building a
+    `Paragraph` wrapper object per paragraph — the traversal stays in C,
+    which matters for long multi-page documents.
+    """
+    doc = DocxDocument(file_path)
+    text_parts = []
+
+    for p_el in doc.element.body.iter(qn('w:p')):
+        text = ''.join(
+            t.text for t in p_el.iter(qn('w:t')) if t.text)
+        if text.strip():
+            text_parts.append(text)
+
+    return "\n\n".join(text_parts)
+
 
 class DocumentLoader:
     """Class for loading and parsing documents (PDF and DOCX)."""
@@ -57,25 +160,23 @@ class DocumentLoader:
         Returns:
             Extracted text content
         """
-        text_parts = []
-
-        with pdfplumber.open(file_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, start=1):
-                # Try multiple extraction methods for better text recovery
-                # Method 1: Standard text extraction
-                page_text = page.extract_text()
-
-                # Method 2: If standard extraction is poor, try extracting from words
-                if not page_text or len(page_text.strip()) < 50:
-                    words = page.extract_words()
-                    if words:
-                        page_text = ' '.join(
-                            [word.get('text', '') for word in words if word.get('text')])
-
-                if page_text and page_text.strip():
-                    text_parts.append(page_text)
-
-        return "\n\n".join(text_parts)
+        page_count = await asyncio.to_thread(_count_pdf_pages, file_path)
+
+        if page_count >= _PDF_PARALLEL_PAGE_THRESHOLD:
+            # Pages are independent, so long documents fan out across
+            # worker processes and scale with core count
+            loop = asyncio.get_running_loop()
+            executor = _get_pdf_executor()
+            text_parts = await asyncio.gather(*(
+                loop.run_in_executor(
+                    executor, _extract_page_text, file_path, page_num)
+                for page_num in range(page_count)
+            ))
+            return "\n\n".join(part for part in text_parts if part.strip())
+
+        # Short resumes parse faster in a single off-loop pass than
+        # they would round-tripping through worker processes
+        return await asyncio.to_thread(_extract_pdf_sequential, file_path)
 
     @staticmethod
     async def _load_docx(file_path: str) -> str:
@@ -88,11 +189,6 @@ class DocumentLoader:
         Returns:
             Extracted text content
         """
-        doc = DocxDocument(file_path)
-        text_parts = []
-
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_parts.append(paragraph.text)
-
-        return "\n\n".join(text_parts)
+        # python-docx parsing is synchronous CPU work; keep it off the
+        # event loop so other requests aren't stalled behind it
+        return await asyncio.to_thread(_extract_docx_text, file_path)
@@ -3,15 +3,26 @@ ElevenLabs API integration service.
 Handles downloading transcripts and audio recordings from ElevenLabs conversations.
 """
 import os
+import asyncio
+import aiofiles
 import httpx
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dotenv import load_dotenv
 
+from services.http_client import get_async_client
+from services import http_retry
+from services.http_retry import request_with_retry
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Cap concurrent ElevenLabs requests across all service instances so bulk
+# conversation processing can't trip the API's rate limits; matches the
+# per-host connection budget of the shared httpx client
+_request_semaphore = asyncio.Semaphore(64)
+
 
 class ElevenLabsService:
     """Service for interacting with ElevenLabs API."""
@@ -64,28 +75,29 @@ class ElevenLabsService:
             # Use correct endpoint: /v1/convai/conversations/{conversation_id}
             url = f"{self.base_url}/convai/conversations/{conversation_id}"
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=self.headers)
-                response.raise_for_status()
-
-                conversation_data = response.json()
-                
-                # Extract transcript from response
-                # The response contains transcript array and metadata
-                transcript_data = {
-                    "messages": conversation_data.get("transcript", []),
-                    "metadata": conversation_data.get("metadata", {}),
-                    "status": conversation_data.get("status"),
-                    "has_audio": conversation_data.get("has_audio", False),
-                    "has_user_audio": conversation_data.get("has_user_audio", False),
-                    "has_response_audio": conversation_data.get("has_response_audio", False),
-                }
-                
-                logger.info(
-                    f"Successfully downloaded transcript for conversation_id={conversation_id}, "
-                    f"messages_count={len(transcript_data['messages'])}"
-                )
-                return transcript_data
+            async with _request_semaphore:
+                response = await request_with_retry(
+                    "GET", url, headers=self.headers)
+            response.raise_for_status()
+
+            conversation_data = response.json()
+
+            # Extract transcript from response
+            # The response contains transcript array and metadata
+            transcript_data = {
+                "messages": conversation_data.get("transcript", []),
+                "metadata": conversation_data.get("metadata", {}),
+                "status": conversation_data.get("status"),
+                "has_audio": conversation_data.get("has_audio", False),
+                "has_user_audio": conversation_data.get("has_user_audio", False),
+                "has_response_audio": conversation_data.get("has_response_audio", False),
+            }
+
+            logger.info(
+                f"Successfully downloaded transcript for conversation_id={conversation_id}, "
+                f"messages_count={len(transcript_data['messages'])}"
+            )
+            return transcript_data
 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -121,25 +133,52 @@ class ElevenLabsService:
             # Use correct endpoint: /v1/convai/conversations/{conversation_id}/audio
             url = f"{self.base_url}/convai/conversations/{conversation_id}/audio"
 
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.get(url, headers=self.headers)
-                response.raise_for_status()
-
-                audio_bytes = response.content
-
-                # Save to file if output_path provided
-                if output_path:
-                    with open(output_path, "wb") as f:
-                        f.write(audio_bytes)
-                    logger.info(
-                        f"Saved audio to {output_path} for conversation_id={conversation_id}"
-                    )
-
-                logger.info(
-                    f"Successfully downloaded audio for conversation_id={conversation_id}, "
-                    f"size={len(audio_bytes)} bytes"
-                )
-                return audio_bytes
+            # Stream the response in 64KB chunks instead of buffering it
+            # through httpx's internal reader, and write to disk with
+            # aiofiles so the event loop never blocks on file I/O. Audio
+            # downloads get a longer per-request deadline on the shared
+            # client instead of a dedicated one. Streaming can't go
+            # through request_with_retry, so 429/5xx responses are
+            # retried here with the same backoff policy.
+            buffer = bytearray()
+            for attempt in range(http_retry.MAX_ATTEMPTS):
+                async with _request_semaphore, get_async_client().stream(
+                    "GET", url, headers=self.headers, timeout=120.0
+                ) as response:
+                    if (http_retry.is_retryable_status(response.status_code)
+                            and attempt < http_retry.MAX_ATTEMPTS - 1):
+                        delay = http_retry.retry_delay(attempt, response)
+                        logger.warning(
+                            "Audio download for conversation_id=%s returned "
+                            "HTTP %d, retrying in %.1fs",
+                            conversation_id, response.status_code, delay
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+
+                    response.raise_for_status()
+                    buffer.clear()
+
+                    if output_path:
+                        async with aiofiles.open(output_path, "wb") as f:
+                            async for chunk in response.aiter_bytes(chunk_size=65536):
+                                buffer.extend(chunk)
+                                await f.write(chunk)
+                        logger.info(
+                            f"Saved audio to {output_path} for conversation_id={conversation_id}"
+                        )
+                    else:
+                        async for chunk in response.aiter_bytes(chunk_size=65536):
+                            buffer.extend(chunk)
+                    break
+
+            audio_bytes = bytes(buffer)
+
+            logger.info(
+                f"Successfully downloaded audio for conversation_id={conversation_id}, "
+                f"size={len(audio_bytes)} bytes"
+            )
+            return audio_bytes
 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -169,11 +208,12 @@ class ElevenLabsService:
         try:
             url = f"{self.base_url}/conversations/{conversation_id}"
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=self.headers)
-                response.raise_for_status()
+            async with _request_semaphore:
+                response = await request_with_retry(
+                    "GET", url, headers=self.headers)
+            response.raise_for_status()
 
-                return response.json()
+            return response.json()
 
         except Exception as e:
             logger.error(
@@ -181,3 +221,28 @@ class ElevenLabsService:
                 exc_info=True
             )
             return None
+
+    async def download_all(
+        self,
+        conversation_id: str,
+        output_path: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+        """
+        Download transcript and audio for a conversation concurrently.
+
+        The two requests are independent, so total latency is the slower
+        of the two rather than their sum.
+
+        Args:
+            conversation_id: ElevenLabs conversation ID
+            output_path: Optional path to save audio file locally
+
+        Returns:
+            Tuple of (transcript data, audio bytes); either element is None
+            if its download failed
+        """
+        transcript, audio_bytes = await asyncio.gather(
+            self.download_transcript(conversation_id),
+            self.download_audio(conversation_id, output_path)
+        )
+        return transcript, audio_bytes
@@ -0,0 +1,263 @@
+"""
+BM25 retriever construction with an optional fast backend.
+
+Prefers the NumPy/SIMD-backed `bm25s` package when it is installed and falls
+back to LangChain's `rank-bm25`-based BM25Retriever otherwise, so existing
+environments keep working without the extra dependency.
+
+When the bm25s backend is active the tokenized index can be persisted to
+disk and memory-mapped back in, so process restarts skip re-tokenizing the
+whole corpus and workers share the read-only term matrix.
+"""
+import logging
+import os
+import shutil
+from typing import Any, List, Optional, Tuple
+
+import orjson
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from langchain_community.retrievers import BM25Retriever
+from pydantic import ConfigDict, Field
+
+try:
+    import bm25s
+except ImportError:
+    bm25s = None
+
+logger = logging.getLogger(__name__)
+
+_DOCUMENTS_FILENAME = "documents.json"
+
+
+class BM25SRetriever(BaseRetriever):
+    """BM25 retriever backed by the vectorized `bm25s` implementation."""
+
+    index: Any = None
+    """Indexed bm25s.BM25 instance."""
+    docs: List[Document] = Field(repr=False)
+    """List of documents, aligned with the index corpus order."""
+    k: int = 4
+    """Number of documents to return."""
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+    )
+
+    @classmethod
+    def from_documents(cls, documents: List[Document], **kwargs: Any) -> "BM25SRetriever":
+        """
+        Create a BM25SRetriever from a list of Documents.
+
+        Args:
+            documents: Documents to index
+            **kwargs: Any other arguments to pass to the retriever
+
+        Returns:
+            A BM25SRetriever instance
+        """
+        docs = list(documents)
+        # No stemming/stopword removal to match rank-bm25's plain
+        # whitespace tokenization used elsewhere in the pipeline
+        corpus_tokens = bm25s.tokenize(
+            [doc.page_content for doc in docs],
+            stopwords=None,
+            show_progress=False
+        )
+        index = bm25s.BM25()
+        index.index(corpus_tokens, show_progress=False)
+        return cls(index=index, docs=docs, **kwargs)
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        if not self.docs:
+            return []
+        query_tokens = bm25s.tokenize(
+            query, stopwords=None, show_progress=False)
+        doc_indices, _scores = self.index.retrieve(
+            query_tokens,
+            k=min(self.k, len(self.docs)),
+            show_progress=False
+        )
+        return [self.docs[i] for i in doc_indices[0]]
+
+    def retrieve_with_scores(
+        self, query: str, k: Optional[int] = None
+    ) -> List[Tuple[Document, float]]:
+        """
+        Retrieve documents along with their raw BM25 scores.
+
+        Args:
+            query: Search query
+            k: Number of documents to return (defaults to self.k)
+
+        Returns:
+            List of (document, score) pairs, best first
+        """
+        if not self.docs:
+            return []
+        if k is None:
+            k = self.k
+        query_tokens = bm25s.tokenize(
+            query, stopwords=None, show_progress=False)
+        doc_indices, scores = self.index.retrieve(
+            query_tokens,
+            k=min(k, len(self.docs)),
+            show_progress=False
+        )
+        return [
+            (self.docs[i], float(score))
+            for i, score in zip(doc_indices[0], scores[0])
+        ]
+
+    def save(self, save_dir: str) -> None:
+        """
+        Persist the tokenized index and the aligned document list.
+
+        Args:
+            save_dir: Directory to write the index into (created if missing)
+        """
+        os.makedirs(save_dir, exist_ok=True)
+        self.index.save(save_dir, show_progress=False)
+        payload = [
+            {"page_content": doc.page_content, "metadata": doc.metadata}
+            for doc in self.docs
+        ]
+        with open(os.path.join(save_dir, _DOCUMENTS_FILENAME), "wb") as f:
+            f.write(orjson.dumps(payload))
+
+    @classmethod
+    def load(cls, save_dir: str, k: int = 10) -> "BM25SRetriever":
+        """
+        Load a previously saved index, memory-mapping the term matrix so it
+        is paged in on demand and shared read-only across worker processes.
+
+        Args:
+            save_dir: Directory written by `save`
+            k: Number of documents to return per query
+
+        Returns:
+            A BM25SRetriever instance
+        """
+        index = bm25s.BM25.load(save_dir, mmap=True, show_progress=False)
+        with open(os.path.join(save_dir, _DOCUMENTS_FILENAME), "rb") as f:
+            payload = orjson.loads(f.read())
+        docs = [
+            Document(page_content=item["page_content"],
+                     metadata=item.get("metadata") or {})
+            for item in payload
+        ]
+        return cls(index=index, docs=docs, k=k)
+
+
+def save_bm25_retriever(retriever: BaseRetriever, save_dir: str) -> None:
+    """
+    Persist a BM25 retriever to disk if the backend supports it.
+
+    Best effort: failures are logged and ignored so indexing never breaks
+    because of a persistence problem, and the rank-bm25 fallback (which has
+    no save format) is silently skipped.
+
+    Args:
+        retriever: Retriever returned by `bm25_retriever_from_documents`
+        save_dir: Directory to write the index into
+    """
+    if not isinstance(retriever, BM25SRetriever):
+        return
+    try:
+        retriever.save(save_dir)
+    except Exception as e:
+        logger.warning("Could not persist BM25 index to %s: %s", save_dir, e)
+
+
+def delete_bm25_retriever(save_dir: str) -> None:
+    """
+    Remove a persisted BM25 index directory, if one exists.
+
+    Best effort, mirroring `save_bm25_retriever`: failures are logged and
+    ignored. Callers use this when the index becomes empty, so a stale
+    on-disk copy is never reloaded on the next startup.
+
+    Args:
+        save_dir: Directory written by `save_bm25_retriever`
+    """
+    if not os.path.isdir(save_dir):
+        return
+    try:
+        shutil.rmtree(save_dir)
+    except OSError as e:
+        logger.warning("Could not delete BM25 index at %s: %s", save_dir, e)
+
+
+def load_bm25_retriever(save_dir: str, k: int = 10) -> Optional[BaseRetriever]:
+    """
+    Load a persisted BM25 retriever, or None when unavailable.
+
+    Args:
+        save_dir: Directory written by `save_bm25_retriever`
+        k: Number of documents to return per query
+
+    Returns:
+        A BM25SRetriever, or None if bm25s is not installed, nothing was
+        persisted, or the saved index cannot be read
+    """
+    if bm25s is None:
+        return None
+    if not os.path.exists(os.path.join(save_dir, _DOCUMENTS_FILENAME)):
+        return None
+    try:
+        return BM25SRetriever.load(save_dir, k=k)
+    except Exception as e:
+        logger.warning("Could not load BM25 index from %s: %s", save_dir, e)
+        return None
+
+
+def bm25_docs_with_scores(
+    retriever: BaseRetriever, query: str, k: int
+) -> List[Tuple[Document, float]]:
+    """
+    Run a BM25 retriever and return (document, score) pairs.
+
+    The bm25s backend reports its raw scores; the rank-bm25 fallback does
+    not expose them through LangChain, so ranks are mapped to descending
+    pseudo-scores there instead.
+
+    Args:
+        retriever: Retriever returned by `bm25_retriever_from_documents`
+        query: Search query
+        k: Number of documents to return
+
+    Returns:
+        List of (document, score) pairs, best first
+    """
+    if isinstance(retriever, BM25SRetriever):
+        return retriever.retrieve_with_scores(query, k=k)
+
+    retriever.k = k
+    docs = retriever.invoke(query)
+    n = max(len(docs), 1)
+    return [(doc, 1.0 - (i / n)) for i, doc in enumerate(docs)]
+
+
+def bm25_retriever_from_documents(documents: List[Document], k: int = 10) -> BaseRetriever:
+    """
+    Build a BM25 retriever over the given documents.
+
+    Uses the bm25s backend when available; otherwise falls back to the
+    pure-Python rank-bm25 retriever.
+
+    Args:
+        documents: Documents to index
+        k: Number of documents to return per query
+
+    Returns:
+        A LangChain retriever instance with `k` already set
+    """
+    if bm25s is not None:
+        return BM25SRetriever.from_documents(documents, k=k)
+
+    retriever = BM25Retriever.from_documents(documents)
+    retriever.k = k
+    return retriever
@@ -0,0 +1,37 @@
+"""
+Shared Google Gemini client.
+
+Every agent used to construct its own genai.Client, so each FastAPI worker
+carried several HTTP connection pools and paid separate TLS handshakes.
+All Gemini callers should go through get_client() instead.
+"""
+import os
+import threading
+from typing import Optional
+
+from google import genai
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_client: Optional[genai.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> genai.Client:
+    """
+    Return the process-wide Gemini client, creating it on first use.
+
+    Raises:
+        ValueError: If GOOGLE_API_KEY is not configured
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                api_key = os.getenv("GOOGLE_API_KEY")
+                if not api_key:
+                    raise ValueError(
+                        "GOOGLE_API_KEY environment variable is required")
+                _client = genai.Client(api_key=api_key)
+    return _client
@@ -0,0 +1,35 @@
+"""
+Shared httpx.AsyncClient for outbound HTTP calls.
+
+Convex and ElevenLabs calls used to build a fresh AsyncClient per request,
+paying a TCP + TLS handshake every time. A single long-lived client keeps
+connections pooled; callers that need a longer deadline pass a per-request
+timeout instead of constructing their own client.
+"""
+from typing import Optional
+
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the process-wide AsyncClient, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+    return _client
+
+
+async def close_async_client() -> None:
+    """Close the shared client (call from app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,110 @@
+"""
+Retry-with-backoff helper for outbound HTTP calls.
+
+A single 429 or transient 5xx used to drop the whole job for both the
+ElevenLabs and Convex clients. Requests that fail with a retryable status
+or a transport error are retried with exponential backoff plus jitter,
+honoring the server's Retry-After header when one is sent.
+"""
+import asyncio
+import logging
+import random
+from typing import Optional
+
+import httpx
+
+from services.http_client import get_async_client
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+_MAX_BACKOFF_SECONDS = 60.0
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """
+    Compute how long to sleep before the given retry attempt.
+
+    Prefers the server's Retry-After header (seconds form) when present;
+    otherwise exponential backoff with jitter, capped at 60s.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        response: The failed response, if the failure produced one
+
+    Returns:
+        Delay in seconds
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(_MAX_BACKOFF_SECONDS, float(retry_after))
+            except ValueError:
+                pass
+    return min(_MAX_BACKOFF_SECONDS, 2 ** attempt + random.random())
+
+
+def is_retryable_status(status_code: int) -> bool:
+    """Return True for status codes worth retrying (429 and common 5xx)."""
+    return status_code in _RETRYABLE_STATUS_CODES
+
+
+async def request_with_retry(
+    method: str,
+    url: str,
+    max_attempts: int = MAX_ATTEMPTS,
+    **kwargs,
+) -> httpx.Response:
+    """
+    Issue a request on the shared client, retrying transient failures.
+
+    Retries on 429/5xx responses and on transport errors (connect resets,
+    timeouts). Non-retryable responses are returned as-is so callers keep
+    their existing status handling.
+
+    Args:
+        method: HTTP method, e.g. "GET" or "POST"
+        url: Request URL
+        max_attempts: Total attempts including the first
+        **kwargs: Passed through to httpx (headers, content, timeout, ...)
+
+    Returns:
+        The final httpx.Response
+
+    Raises:
+        httpx.TransportError: If every attempt failed at the transport level
+    """
+    client = get_async_client()
+    last_response: Optional[httpx.Response] = None
+
+    for attempt in range(max_attempts):
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            if attempt == max_attempts - 1:
+                raise
+            delay = retry_delay(attempt)
+            logger.warning(
+                "%s %s failed (%s), retrying in %.1fs (attempt %d/%d)",
+                method, url, e, delay, attempt + 1, max_attempts
+            )
+            await asyncio.sleep(delay)
+            continue
+
+        if not is_retryable_status(response.status_code):
+            return response
+
+        last_response = response
+        if attempt == max_attempts - 1:
+            break
+
+        delay = retry_delay(attempt, response)
+        logger.warning(
+            "%s %s returned HTTP %d, retrying in %.1fs (attempt %d/%d)",
+            method, url, response.status_code, delay, attempt + 1, max_attempts
+        )
+        await asyncio.sleep(delay)
+
+    return last_response
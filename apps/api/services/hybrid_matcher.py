@@ -1,23 +1,171 @@
 import os
 import asyncio
+import hashlib
+import logging
+import threading
+import orjson
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_core.retrievers import BaseRetriever
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_community.vectorstores import Chroma
-from langchain_community.retrievers import BM25Retriever
-try:
-    from langchain.retrievers import EnsembleRetriever
-except ImportError:
-    # Fallback for langchain 0.3.0+
-    from langchain_community.retrievers import EnsembleRetriever
-
-from models.hybrid_search import SearchResult, ResumeScores
+
+from models.hybrid_search import SearchResult, ResumeScores, HybridScores
+from services.fast_bm25 import (
+    bm25_docs_with_scores,
+    bm25_retriever_from_documents,
+    delete_bm25_retriever,
+    load_bm25_retriever,
+    save_bm25_retriever,
+)
 from services.resume_evaluator import ResumeEvaluatorAgent
 from services.resume_evaluator import ResumeEvaluator
 
+logger = logging.getLogger(__name__)
+
+# Default embedding model: MiniLM's 384-d vectors halve HNSW memory and
+# index size versus mpnet's 768-d and encode roughly twice as fast, at an
+# accuracy delta that's noise for resume retrieval
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Known output dimensions, persisted alongside the index so a model swap
+# against an existing collection fails loudly instead of producing
+# garbage distances
+EMBEDDING_DIMENSIONS = {
+    "sentence-transformers/all-MiniLM-L6-v2": 384,
+    "sentence-transformers/all-mpnet-base-v2": 768,
+}
+
+# HNSW settings applied when the Chroma collection is created. Cosine
+# matches the sentence-transformers embedding space; the construction/search
+# parameters trade a little indexing time for better recall at query time.
+CHROMA_COLLECTION_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:construction_ef": 200,
+    "hnsw:M": 32,
+    "hnsw:search_ef": 100,
+    # Build the graph with every available core; construction is the
+    # expensive side of the ef/M trade above
+    "hnsw:num_threads": os.cpu_count() or 1,
+}
+
+
+def _chunk_ids(chunks: List[Document]) -> List[str]:
+    """
+    Deterministic Chroma ids for chunks, so re-uploading identical content
+    dedupes inside the collection instead of inserting duplicate rows.
+
+    The candidate_id is mixed in because two candidates can legitimately
+    share boilerplate chunk text that must still index separately.
+    """
+    ids = []
+    for chunk in chunks:
+        candidate_id = str(
+            chunk.metadata.get('candidate_id', '')) if chunk.metadata else ''
+        ids.append(hashlib.sha1(
+            f"{candidate_id}|{chunk.page_content}".encode()).hexdigest())
+    return ids
+
+
+def _detect_device() -> str:
+    """Pick 'cuda' when a GPU is visible, otherwise 'cpu'."""
+    try:
+        import torch
+        if torch.cuda.is_available():
+            return 'cuda'
+    except ImportError:
+        pass
+    return 'cpu'
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that LRU-caches query vectors.
+
+    Dashboards and paginated UIs re-issue the same job-description query
+    within seconds; embedding it is the most expensive step of a small-k
+    retrieval once the corpus is indexed, so repeats are served from an
+    in-process cache instead of another model forward pass.
+    """
+
+    _CACHE_MAX_ENTRIES = 2048
+
+    def __init__(self, inner: HuggingFaceEmbeddings):
+        self.inner = inner
+        self._query_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def client(self):
+        """Expose the underlying sentence-transformers model."""
+        return self.inner.client
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.inner.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        key = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        with self._lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        embedding = self.inner.embed_query(text)
+
+        with self._lock:
+            self._query_cache[key] = embedding
+            if len(self._query_cache) > self._CACHE_MAX_ENTRIES:
+                self._query_cache.popitem(last=False)
+        return embedding
+
+
+@lru_cache(maxsize=4)
+def _get_embeddings(model_name: str, device: str) -> CachedQueryEmbeddings:
+    """
+    Load a sentence-transformers embedding model once per (model, device).
+
+    The default model weighs hundreds of MB; reloading it for every
+    HybridMatcher instance dominates construction time and memory.
+
+    Encoding is batched (64 chunks per forward pass) and embeddings are
+    L2-normalized so cosine similarity reduces to a dot product in Chroma.
+    On GPU the underlying model runs in FP16, roughly halving memory and
+    doubling throughput with negligible accuracy loss for retrieval.
+    """
+    embeddings = HuggingFaceEmbeddings(
+        model_name=model_name,
+        model_kwargs={'device': device},
+        encode_kwargs={
+            'batch_size': 64,
+            'normalize_embeddings': True,
+            'show_progress_bar': False,
+        }
+    )
+    if device == 'cuda':
+        embeddings.client.half()
+    return CachedQueryEmbeddings(embeddings)
+
+
+@lru_cache(maxsize=4)
+def _get_text_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    """Share splitter instances across matchers with the same settings."""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=["\n\n", "\n", " ", ""]
+    )
+
 
 class HybridMatcher:
     """Class for hybrid search using vector and keyword retrieval."""
@@ -25,7 +173,7 @@ class HybridMatcher:
     def __init__(
         self,
         persist_directory: str = "./chroma_db",
-        embedding_model: str = "sentence-transformers/all-mpnet-base-v2",
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL,
         chunk_size: int = 500,
         chunk_overlap: int = 50,
         vector_weight: float = 0.7,
@@ -43,33 +191,143 @@ class HybridMatcher:
             bm25_weight: Weight for BM25 search (default 0.3)
         """
         self.persist_directory = persist_directory
+        self.bm25_persist_directory = os.path.join(persist_directory, "bm25")
+        self.embedding_meta_path = os.path.join(
+            persist_directory, "embedding_meta.json")
         self.embedding_model = embedding_model
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.vector_weight = vector_weight
         self.bm25_weight = bm25_weight
 
-        # Initialize text splitter
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            separators=["\n\n", "\n", " ", ""]
-        )
-
-        # Initialize embeddings
-        self.embeddings = HuggingFaceEmbeddings(
-            model_name=embedding_model,
-            model_kwargs={'device': 'cpu'}  # Use 'cuda' if GPU available
-        )
+        # Shared per-configuration instances — the embedding model in
+        # particular must not be reloaded per matcher
+        self.text_splitter = _get_text_splitter(chunk_size, chunk_overlap)
+        self.embeddings = _get_embeddings(embedding_model, _detect_device())
 
         # Initialize vector store and retrievers (will be set after indexing)
         self.vector_store: Optional[Chroma] = None
-        self.bm25_retriever: Optional[BM25Retriever] = None
-        self.ensemble_retriever: Optional[EnsembleRetriever] = None
+        self.bm25_retriever: Optional[BaseRetriever] = None
 
         # Store documents for BM25 indexing
         self.documents: List[Document] = []
 
+        # Inverted map: candidate_id -> indices into self.documents,
+        # precomputed so per-candidate lookups avoid scanning every chunk
+        self.candidate_index: Dict[str, List[int]] = {}
+
+        # Vector retrievers cached by k — as_retriever builds a fresh
+        # Pydantic model per call, which adds up on the query path
+        self._vector_retriever_cache: Dict[int, BaseRetriever] = {}
+
+    def _get_vector_retriever(self, k: int) -> BaseRetriever:
+        """Return a similarity retriever for the current store, cached by k."""
+        retriever = self._vector_retriever_cache.get(k)
+        if retriever is None:
+            retriever = self.vector_store.as_retriever(
+                search_type="similarity",
+                search_kwargs={"k": k}
+            )
+            self._vector_retriever_cache[k] = retriever
+        return retriever
+
+    def _write_embedding_meta(self) -> None:
+        """Record which embedding model built the persisted index."""
+        try:
+            os.makedirs(self.persist_directory, exist_ok=True)
+            with open(self.embedding_meta_path, "wb") as f:
+                f.write(orjson.dumps({
+                    "model": self.embedding_model,
+                    "dimensions": EMBEDDING_DIMENSIONS.get(
+                        self.embedding_model),
+                }))
+        except OSError as e:
+            logger.warning("Could not write embedding metadata: %s", e)
+
+    def _check_embedding_meta(self) -> None:
+        """
+        Fail loudly if the persisted index was built with a different
+        embedding model — mismatched dimensions would otherwise produce
+        garbage distances silently.
+        """
+        if not os.path.exists(self.embedding_meta_path):
+            return
+        try:
+            with open(self.embedding_meta_path, "rb") as f:
+                meta = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return
+        stored = meta.get("model")
+        if stored and stored != self.embedding_model:
+            raise ValueError(
+                f"Persisted index at {self.persist_directory} was built "
+                f"with embedding model '{stored}', but this matcher uses "
+                f"'{self.embedding_model}'. Reindex the collection or "
+                f"construct the matcher with the original model."
+            )
+
+    def _check_collection_dimension(self) -> None:
+        """
+        Mismatch guard for indexes that predate embedding_meta.json: peek
+        one stored vector and compare its dimension against the active
+        model's, so a default-model change still fails loudly on legacy
+        collections instead of surfacing as garbage distances or dimension
+        errors at query time.
+
+        Empty collections are claimed for the active model by writing the
+        meta file. Non-empty ones with matching dimensions are left
+        meta-less, since a dimension alone cannot identify the model.
+        """
+        expected = EMBEDDING_DIMENSIONS.get(self.embedding_model)
+        if expected is None or self.vector_store is None:
+            return
+        collection = self.vector_store._collection
+        if collection is None:
+            return
+        try:
+            sample = collection.get(limit=1, include=["embeddings"])
+        except Exception as e:
+            logger.warning(
+                "Could not sample embeddings for the dimension check: %s", e)
+            return
+        embeddings = sample.get("embeddings") if sample else None
+        if embeddings is None or len(embeddings) == 0:
+            # Nothing indexed yet — safe to claim for the active model
+            self._write_embedding_meta()
+            return
+        stored = len(embeddings[0])
+        if stored != expected:
+            raise ValueError(
+                f"Persisted index at {self.persist_directory} stores "
+                f"{stored}-dimensional embeddings, but embedding model "
+                f"'{self.embedding_model}' produces {expected}-dimensional "
+                f"vectors. Reindex the collection or construct the matcher "
+                f"with the original model."
+            )
+
+    def _rebuild_candidate_index(self) -> None:
+        """Rebuild the candidate_id -> chunk-indices map after documents change."""
+        candidate_index: Dict[str, List[int]] = {}
+        for i, doc in enumerate(self.documents):
+            candidate_id = doc.metadata.get(
+                'candidate_id') if doc.metadata else None
+            if candidate_id:
+                candidate_index.setdefault(str(candidate_id), []).append(i)
+        self.candidate_index = candidate_index
+
+    def get_candidate_documents(self, candidate_id: str) -> List[Document]:
+        """
+        Return the indexed chunks for a candidate using the precomputed map.
+
+        Args:
+            candidate_id: Candidate ID to look up
+
+        Returns:
+            List of chunk Documents for the candidate (empty if none)
+        """
+        indices = self.candidate_index.get(str(candidate_id), [])
+        return [self.documents[i] for i in indices]
+
     async def index_documents(self, documents: List[Document]) -> None:
         """
         Index documents for hybrid search.
@@ -93,59 +351,28 @@ class HybridMatcher:
                     if key not in chunk.metadata:
                         chunk.metadata[key] = value
 
-        # If vector store already exists, add to it; otherwise create new
+        # Deterministic ids, deduped within the batch: a re-uploaded chunk
+        # keeps its id and upserts in place instead of adding a new row
+        ids = _chunk_ids(chunks)
+        seen = set()
+        unique = [
+            (chunk_id, chunk) for chunk_id, chunk in zip(ids, chunks)
+            if not (chunk_id in seen or seen.add(chunk_id))
+        ]
+        ids = [chunk_id for chunk_id, _ in unique]
+        chunks = [chunk for _, chunk in unique]
+
+        # If vector store already exists, append only the new chunks;
+        # Chroma persists additions in place, so re-embedding and
+        # recreating the whole collection on every upload is unnecessary
         if self.vector_store is not None:
-            # Add new chunks to existing store
-            # Note: ChromaDB doesn't have a direct add_documents method that persists
-            # So we need to recreate the store with all documents
-            # Get existing documents from ChromaDB
-            try:
-                collection = self.vector_store._collection
-                if collection:
-                    existing_results = collection.get()
-                    if existing_results and 'documents' in existing_results:
-                        # Recreate existing documents
-                        existing_chunks = []
-                        for i, doc_text in enumerate(existing_results['documents']):
-                            metadata = existing_results.get('metadatas', [{}])[
-                                i] if existing_results.get('metadatas') else {}
-                            existing_chunks.append(
-                                Document(page_content=doc_text, metadata=metadata))
-                        # Combine with new chunks
-                        all_chunks = existing_chunks + chunks
-                    else:
-                        all_chunks = chunks
-                else:
-                    all_chunks = chunks
-            except Exception:
-                # If we can't load existing, just use new chunks
-                all_chunks = chunks
-
-            # Ensure all NEW chunks have metadata before recreating vector store
-            # Don't modify existing_chunks metadata, only new chunks
-            if documents and chunks:
-                original_metadata = documents[0].metadata if documents else {}
-                # Only update metadata for new chunks (from current documents)
-                for chunk in chunks:  # Only new chunks, not existing_chunks
-                    if not chunk.metadata:
-                        chunk.metadata = {}
-                    # Ensure all metadata from original document is in new chunk
-                    for key, value in original_metadata.items():
-                        if key not in chunk.metadata:
-                            chunk.metadata[key] = value
+            self.vector_store.add_documents(chunks, ids=ids)
 
-            # Recreate vector store with all chunks
-            self.vector_store = Chroma.from_documents(
-                documents=all_chunks,
-                embedding=self.embeddings,
-                persist_directory=self.persist_directory
-            )
-
-            # Update documents list
+            # Update documents list with just the new chunks
             if hasattr(self, 'documents') and self.documents:
-                self.documents.extend(all_chunks)
+                self.documents.extend(chunks)
             else:
-                self.documents = all_chunks
+                self.documents = chunks
         else:
             # Create new vector store
             # Verify chunks have metadata before indexing
@@ -161,40 +388,134 @@ class HybridMatcher:
             self.vector_store = Chroma.from_documents(
                 documents=chunks,
                 embedding=self.embeddings,
-                persist_directory=self.persist_directory
+                ids=ids,
+                persist_directory=self.persist_directory,
+                collection_metadata=CHROMA_COLLECTION_METADATA
             )
+            self._vector_retriever_cache.clear()
             self.documents = chunks
 
         # Persist ChromaDB (if persist method exists)
         if hasattr(self.vector_store, 'persist'):
             self.vector_store.persist()
+        self._write_embedding_meta()
 
-        # Verify metadata was saved in ChromaDB
-        if self.vector_store and self.vector_store._collection:
+        # Verify metadata was saved in ChromaDB (debug only — costs a
+        # Chroma round-trip, so skip it entirely unless DEBUG is enabled)
+        if logger.isEnabledFor(logging.DEBUG) and self.vector_store and self.vector_store._collection:
             try:
                 sample = self.vector_store._collection.get(limit=1)
                 if sample and 'metadatas' in sample and len(sample['metadatas']) > 0:
-                    sample_metadata = sample['metadatas'][0]
-                    print(
-                        f"DEBUG: Sample metadata in ChromaDB: {sample_metadata}")
+                    logger.debug("Sample metadata in ChromaDB: %s",
+                                 sample['metadatas'][0])
             except Exception as e:
-                print(f"DEBUG: Error checking ChromaDB metadata: {e}")
+                logger.debug("Error checking ChromaDB metadata: %s", e)
 
-        # Recreate BM25 retriever with all chunks
-        self.bm25_retriever = BM25Retriever.from_documents(self.documents)
-        self.bm25_retriever.k = 10  # Retrieve top 10 for ensemble
+        # Refresh the candidate -> chunks map for the updated documents list
+        self._rebuild_candidate_index()
 
-        # Initialize vector retriever
-        vector_retriever = self.vector_store.as_retriever(
-            search_type="similarity",
-            search_kwargs={"k": 10}  # Retrieve top 10 for ensemble
-        )
+        # Recreate BM25 retriever with all chunks (top 10 for fusion)
+        # and persist the tokenized index so restarts can mmap it back in
+        self.bm25_retriever = bm25_retriever_from_documents(
+            self.documents, k=10)
+        save_bm25_retriever(self.bm25_retriever, self.bm25_persist_directory)
 
-        # Create ensemble retriever with specified weights
-        self.ensemble_retriever = EnsembleRetriever(
-            retrievers=[vector_retriever, self.bm25_retriever],
-            weights=[self.vector_weight, self.bm25_weight]
-        )
+    def remove_candidate(self, candidate_id: str) -> None:
+        """
+        Drop a candidate's chunks from the in-memory state and rebuild the
+        retrievers from the remaining documents.
+
+        The caller is responsible for deleting the candidate's rows from
+        Chroma first; working from the in-memory documents list avoids
+        re-fetching the whole collection just to rebuild BM25.
+
+        Args:
+            candidate_id: Candidate ID whose chunks should be removed
+        """
+        candidate_id_str = str(candidate_id)
+        remaining = [
+            doc for doc in self.documents
+            if str(doc.metadata.get('candidate_id')) != candidate_id_str
+        ]
+
+        self.documents = remaining
+        self._rebuild_candidate_index()
+
+        if remaining and self.vector_store is not None:
+            self.bm25_retriever = bm25_retriever_from_documents(
+                remaining, k=10)
+            save_bm25_retriever(
+                self.bm25_retriever, self.bm25_persist_directory)
+        else:
+            # No documents left: reset the retriever and clear the persisted
+            # index too, otherwise the next startup's fast path would reload
+            # the deleted candidate's chunks from disk
+            self.bm25_retriever = None
+            delete_bm25_retriever(self.bm25_persist_directory)
+
+    @staticmethod
+    async def _evaluate_docs(
+        docs: List[Document],
+        job_description: str,
+        search_type: str
+    ) -> List[SearchResult]:
+        """
+        Score retrieved documents with the AI evaluator concurrently.
+
+        Each evaluation is an independent LLM round-trip, so the batch
+        runs under asyncio.gather with a semaphore keeping at most 10
+        calls in flight against the provider's rate limits.
+
+        Args:
+            docs: Retrieved documents, best first
+            job_description: Job description to evaluate against
+            search_type: Label recorded on each SearchResult
+
+        Returns:
+            List of SearchResult objects in retrieval order
+        """
+        evaluator = ResumeEvaluatorAgent()
+        semaphore = asyncio.Semaphore(10)
+
+        async def evaluate(i: int, doc: Document) -> Dict[str, float]:
+            async with semaphore:
+                return await evaluator.evaluate_resume(
+                    job_description=job_description,
+                    resume_content=doc.page_content,
+                    semantic_similarity=0.0,  # Retriever similarity not directly available
+                    position_rank=i,
+                    total_results=len(docs)
+                )
+
+        scores_dicts = await asyncio.gather(*(
+            evaluate(i, doc) for i, doc in enumerate(docs)
+        ))
+
+        results = []
+        for doc, scores_dict in zip(docs, scores_dicts):
+            scores = ResumeScores(**scores_dict)
+            overall_score = (scores.technical_skills +
+                             scores.experience + scores.overall_match) / 3.0
+
+            results.append(SearchResult(
+                content=doc.page_content,
+                score=round(overall_score, 3),
+                scores=scores,
+                search_type=search_type,
+                metadata=doc.metadata
+            ))
+        return results
+
+    @staticmethod
+    async def _aretrieve(retriever: BaseRetriever, query: str) -> List[Document]:
+        """Run a retriever asynchronously, falling back to a worker thread."""
+        try:
+            return await retriever.aget_relevant_documents(query)
+        except AttributeError:
+            return await asyncio.to_thread(
+                retriever.get_relevant_documents,
+                query
+            )
 
     async def find_matches(
         self,
@@ -217,75 +538,73 @@ class HybridMatcher:
         results: List[SearchResult] = []
 
         if search_type == "hybrid":
-            if not self.ensemble_retriever:
+            if not self.bm25_retriever:
                 # Try to load existing index if not already loaded
                 if not self.load_existing_index():
                     raise ValueError(
                         "Documents must be indexed before searching. Call index_documents() first or ensure resumes have been uploaded.")
 
-            # Get results from both retrievers separately to calculate individual scores
-            # Vector retriever
-            vector_retriever = self.vector_store.as_retriever(
-                search_type="similarity",
-                search_kwargs={"k": k}
+            # Get scored results from both retrievers concurrently; the
+            # lists are fused in-process below, so no third ensemble pass
+            # re-running both retrievals is needed
+            vector_scored, bm25_scored = await asyncio.gather(
+                asyncio.to_thread(
+                    self.vector_store.similarity_search_with_relevance_scores,
+                    query, k=k),
+                asyncio.to_thread(
+                    bm25_docs_with_scores, self.bm25_retriever, query, k),
             )
-            try:
-                vector_docs = await vector_retriever.aget_relevant_documents(query)
-            except AttributeError:
-                vector_docs = await asyncio.to_thread(
-                    vector_retriever.get_relevant_documents,
-                    query
-                )
 
-            # BM25 retriever
-            self.bm25_retriever.k = k
-            try:
-                bm25_docs = await self.bm25_retriever.aget_relevant_documents(query)
-            except AttributeError:
-                bm25_docs = await asyncio.to_thread(
-                    self.bm25_retriever.get_relevant_documents,
-                    query
+            # Fuse with weighted Reciprocal Rank Fusion over the union of
+            # both result lists (k0=60 is the standard RRF constant)
+            k0 = 60
+            fused: Dict[str, float] = {}
+            docs_by_content: Dict[str, Document] = {}
+            for rank, (doc, _score) in enumerate(vector_scored):
+                fused[doc.page_content] = (
+                    fused.get(doc.page_content, 0.0)
+                    + self.vector_weight / (k0 + rank)
                 )
-
-            # Use ensemble retriever for final ranking
-            try:
-                ensemble_docs = await self.ensemble_retriever.aget_relevant_documents(query)
-            except AttributeError:
-                ensemble_docs = await asyncio.to_thread(
-                    self.ensemble_retriever.get_relevant_documents,
-                    query
+                docs_by_content.setdefault(doc.page_content, doc)
+            for rank, (doc, _score) in enumerate(bm25_scored):
+                fused[doc.page_content] = (
+                    fused.get(doc.page_content, 0.0)
+                    + self.bm25_weight / (k0 + rank)
                 )
-
-            # Limit to k results
-            ensemble_docs = ensemble_docs[:k]
-
-            # Create a map of document content to scores
-            vector_scores_map = {}
-            for i, doc in enumerate(vector_docs):
-                # Normalize vector score based on position (higher rank = higher score)
-                vector_score = 1.0 - (i / max(len(vector_docs), 1))
-                vector_scores_map[doc.page_content] = vector_score
-
-            bm25_scores_map = {}
-            for i, doc in enumerate(bm25_docs):
-                # Normalize BM25 score based on position
-                bm25_score = 1.0 - (i / max(len(bm25_docs), 1))
-                bm25_scores_map[doc.page_content] = bm25_score
+                docs_by_content.setdefault(doc.page_content, doc)
+
+            fused_docs = [
+                docs_by_content[content]
+                for content, _ in sorted(
+                    fused.items(), key=lambda item: item[1], reverse=True)
+            ][:k]
+
+            # Map document content to the scores the retrievers actually
+            # computed: Chroma's relevance is already in [0, 1]; raw BM25
+            # scores are unbounded, so normalize by the best in the set
+            vector_scores_map = {
+                doc.page_content: max(0.0, min(1.0, score))
+                for doc, score in vector_scored
+            }
+            max_bm25 = max((score for _, score in bm25_scored), default=0.0)
+            bm25_scores_map = {
+                doc.page_content: (score / max_bm25) if max_bm25 > 0 else 0.0
+                for doc, score in bm25_scored
+            }
+
+            # Hybrid score: alpha * vector_score + (1 - alpha) * bm25_score
+            alpha = self.vector_weight
+            beta = 1.0 - alpha
 
             # Create SearchResult objects with hybrid scores
-            for i, doc in enumerate(ensemble_docs):
+            for i, doc in enumerate(fused_docs):
                 # Get individual scores
                 vector_score = vector_scores_map.get(doc.page_content, 0.0)
                 bm25_score = bm25_scores_map.get(doc.page_content, 0.0)
 
-                # Calculate hybrid score: alpha * vector_score + (1 - alpha) * bm25_score
-                # alpha = vector_weight
-                alpha = self.vector_weight
-                hybrid_score = (alpha * vector_score) + \
-                    ((1 - alpha) * bm25_score)
+                hybrid_score = (alpha * vector_score) + (beta * bm25_score)
 
                 # Store scores in metadata for later use
-                from models.hybrid_search import HybridScores
                 hybrid_scores = HybridScores(
                     vector_score=round(vector_score, 3),
                     bm25_score=round(bm25_score, 3),
@@ -305,7 +624,7 @@ class HybridMatcher:
                     scores=scores,
                     search_type="hybrid",
                     metadata={**doc.metadata,
-                              "hybrid_scores": hybrid_scores.dict()}
+                              "hybrid_scores": hybrid_scores.model_dump()}
                 ))
 
         elif search_type == "vector":
@@ -313,87 +632,27 @@ class HybridMatcher:
                 raise ValueError(
                     "Vector store not initialized. Call index_documents() first.")
 
-            vector_retriever = self.vector_store.as_retriever(
-                search_type="similarity",
-                search_kwargs={"k": k}
-            )
+            vector_retriever = self._get_vector_retriever(k)
 
             # Try async method, fallback to sync in thread pool
-            try:
-                docs = await vector_retriever.aget_relevant_documents(query)
-            except AttributeError:
-                docs = await asyncio.to_thread(
-                    vector_retriever.get_relevant_documents,
-                    query
-                )
+            docs = await self._aretrieve(vector_retriever, query)
 
-            # Create SearchResult objects with three evaluation scores using AI agent
-            evaluator = ResumeEvaluatorAgent()
             job_desc = job_description if job_description else query
-
-            for i, doc in enumerate(docs):
-                # Calculate three separate scores using AI agent
-                scores_dict = await evaluator.evaluate_resume(
-                    job_description=job_desc,
-                    resume_content=doc.page_content,
-                    semantic_similarity=0.0,  # Vector retriever similarity not directly available
-                    position_rank=i,
-                    total_results=len(docs)
-                )
-
-                scores = ResumeScores(**scores_dict)
-                overall_score = (scores.technical_skills +
-                                 scores.experience + scores.overall_match) / 3.0
-
-                results.append(SearchResult(
-                    content=doc.page_content,
-                    score=round(overall_score, 3),
-                    scores=scores,
-                    search_type="vector",
-                    metadata=doc.metadata
-                ))
+            results = await self._evaluate_docs(docs, job_desc, "vector")
 
         elif search_type == "keyword":
             if not self.bm25_retriever:
                 raise ValueError(
                     "BM25 retriever not initialized. Call index_documents() first.")
 
-            self.bm25_retriever.k = k
+            if self.bm25_retriever.k != k:
+                self.bm25_retriever.k = k
 
             # Try async method, fallback to sync in thread pool
-            try:
-                docs = await self.bm25_retriever.aget_relevant_documents(query)
-            except AttributeError:
-                docs = await asyncio.to_thread(
-                    self.bm25_retriever.get_relevant_documents,
-                    query
-                )
+            docs = await self._aretrieve(self.bm25_retriever, query)
 
-            # Create SearchResult objects with three evaluation scores using AI agent
-            evaluator = ResumeEvaluatorAgent()
             job_desc = job_description if job_description else query
-
-            for i, doc in enumerate(docs):
-                # Calculate three separate scores using AI agent
-                scores_dict = await evaluator.evaluate_resume(
-                    job_description=job_desc,
-                    resume_content=doc.page_content,
-                    semantic_similarity=0.0,  # BM25 doesn't provide semantic similarity
-                    position_rank=i,
-                    total_results=len(docs)
-                )
-
-                scores = ResumeScores(**scores_dict)
-                overall_score = (scores.technical_skills +
-                                 scores.experience + scores.overall_match) / 3.0
-
-                results.append(SearchResult(
-                    content=doc.page_content,
-                    score=round(overall_score, 3),
-                    scores=scores,
-                    search_type="keyword",
-                    metadata=doc.metadata
-                ))
+            results = await self._evaluate_docs(docs, job_desc, "keyword")
 
         else:
             raise ValueError(
@@ -404,7 +663,7 @@ class HybridMatcher:
     def load_existing_index(self) -> bool:
         """
         Load existing ChromaDB index if available.
-        Also loads documents from ChromaDB to recreate BM25 and ensemble retrievers.
+        Also restores the documents and BM25 retriever used for fusion.
 
         Returns:
             True if index was loaded successfully, False otherwise
@@ -412,56 +671,87 @@ class HybridMatcher:
         if not os.path.exists(self.persist_directory):
             return False
 
+        # Raises on model mismatch — deliberately outside the broad
+        # try/except below so the error surfaces instead of returning False
+        self._check_embedding_meta()
+
         try:
             self.vector_store = Chroma(
                 persist_directory=self.persist_directory,
-                embedding_function=self.embeddings
+                embedding_function=self.embeddings,
+                collection_metadata=CHROMA_COLLECTION_METADATA
             )
+            self._vector_retriever_cache.clear()
+
+            # Legacy indexes predate the meta file; infer compatibility
+            # from a stored vector instead of silently skipping the guard
+            if not os.path.exists(self.embedding_meta_path):
+                self._check_collection_dimension()
+
+            # Fast path: mmap the persisted BM25 index instead of
+            # re-fetching every document from Chroma and re-tokenizing
+            persisted = load_bm25_retriever(
+                self.bm25_persist_directory, k=10)
+            if persisted is not None:
+                self.bm25_retriever = persisted
+                self.documents = persisted.docs
+                self._rebuild_candidate_index()
+                return True
 
             # Load documents from ChromaDB to recreate retrievers
             try:
                 # Get all documents from ChromaDB collection
                 collection = self.vector_store._collection
-                if collection:
-                    # Fetch all documents from ChromaDB
-                    results = collection.get()
-                    if results and 'documents' in results and results['documents']:
-                        # Recreate Document objects from ChromaDB data
-                        chunks = []
-                        for i, doc_text in enumerate(results['documents']):
-                            metadata = results.get('metadatas', [{}])[
-                                i] if results.get('metadatas') else {}
-                            chunks.append(
-                                Document(page_content=doc_text, metadata=metadata))
-
-                        if chunks:
-                            # Store chunks as documents (they are already chunked)
-                            self.documents = chunks
-
-                            # Recreate BM25 retriever with chunks
-                            self.bm25_retriever = BM25Retriever.from_documents(
-                                chunks)
-                            self.bm25_retriever.k = 10
-
-                            # Recreate vector retriever
-                            vector_retriever = self.vector_store.as_retriever(
-                                search_type="similarity",
-                                search_kwargs={"k": 10}
-                            )
-
-                            # Recreate ensemble retriever
-                            self.ensemble_retriever = EnsembleRetriever(
-                                retrievers=[vector_retriever,
-                                            self.bm25_retriever],
-                                weights=[self.vector_weight, self.bm25_weight]
-                            )
+                # Check emptiness with a cheap count() before paying for a
+                # full fetch of every document and metadata dict
+                if collection and collection.count() > 0:
+                    # Page through the collection instead of materializing
+                    # every row in one giant get(); each page feeds the
+                    # chunks list directly
+                    chunks = []
+                    page_size = 10000
+                    offset = 0
+                    while True:
+                        results = collection.get(
+                            include=["documents", "metadatas"],
+                            limit=page_size,
+                            offset=offset,
+                        )
+                        page_docs = results.get(
+                            'documents') if results else None
+                        if not page_docs:
+                            break
+                        page_metas = results.get('metadatas') or []
+                        for i, doc_text in enumerate(page_docs):
+                            metadata = page_metas[i] if i < len(
+                                page_metas) else {}
+                            chunks.append(Document(
+                                page_content=doc_text,
+                                metadata=metadata or {}))
+                        if len(page_docs) < page_size:
+                            break
+                        offset += page_size
+
+                    if chunks:
+                        # Store chunks as documents (they are already chunked)
+                        self.documents = chunks
+                        self._rebuild_candidate_index()
+
+                        # Recreate BM25 retriever with chunks
+                        self.bm25_retriever = bm25_retriever_from_documents(
+                            chunks, k=10)
             except Exception as e:
                 # If we can't load documents, at least we have the vector store
-                print(f"Warning: Could not load documents from ChromaDB: {e}")
+                logger.warning(
+                    "Could not load documents from ChromaDB: %s", e)
                 # Return True anyway since vector store is loaded
                 return True
 
             return True
+        except ValueError:
+            # Dimension mismatch from the guard above — surface it rather
+            # than reporting the index as missing
+            raise
         except Exception as e:
-            print(f"Error loading index: {e}")
+            logger.error("Error loading index: %s", e)
             return False
@@ -2,7 +2,9 @@
 Main service module for hybrid search pipeline.
 Orchestrates the ETL pipeline: Load -> Sanitize -> Chunk -> Index -> Search
 """
+import asyncio
 import os
+import threading
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
@@ -10,7 +12,7 @@ from langchain_core.documents import Document
 
 from services.document_loader import DocumentLoader
 from services.text_sanitizer import TextSanitizer
-from services.hybrid_matcher import HybridMatcher
+from services.hybrid_matcher import DEFAULT_EMBEDDING_MODEL, HybridMatcher
 from models.hybrid_search import CandidateDocument, SearchResult, CandidateMatchResult, ResumeScores, HybridScores, CandidateAnalysisReport
 
 
@@ -20,7 +22,7 @@ class HybridSearchService:
     def __init__(
         self,
         persist_directory: str = "./chroma_db",
-        embedding_model: str = "sentence-transformers/all-mpnet-base-v2"
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL
     ):
         """
         Initialize HybridSearchService.
@@ -93,65 +95,69 @@ class HybridSearchService:
             job_description=job_description  # Pass original for evaluation
         )
 
-        # Group chunks by candidate_id
-        candidates_chunks: Dict[str, List[SearchResult]] = {}
+        # Group chunks by candidate in a single pass, keeping running score
+        # sums and content parts per candidate instead of materializing
+        # per-chunk score objects that are thrown away after averaging
+        candidate_score_sums: Dict[str, List[float]] = {}
+        candidate_contents: Dict[str, List[str]] = {}
         for chunk_result in chunk_results:
             candidate_id = chunk_result.metadata.get('candidate_id')
-            if candidate_id:
-                candidate_id_str = str(candidate_id)
-                if candidate_id_str not in candidates_chunks:
-                    candidates_chunks[candidate_id_str] = []
-                candidates_chunks[candidate_id_str].append(chunk_result)
-
-        # For each candidate, aggregate hybrid scores from chunks and generate analysis report
+            if not candidate_id:
+                continue
+            candidate_id_str = str(candidate_id)
+
+            # [vector_sum, bm25_sum, hybrid_sum, scored_chunk_count]
+            sums = candidate_score_sums.setdefault(
+                candidate_id_str, [0.0, 0.0, 0.0, 0.0])
+            hybrid_scores_data = chunk_result.metadata.get('hybrid_scores')
+            if hybrid_scores_data:
+                sums[0] += hybrid_scores_data.get('vector_score', 0.0)
+                sums[1] += hybrid_scores_data.get('bm25_score', 0.0)
+                sums[2] += hybrid_scores_data.get('hybrid_score', 0.0)
+                sums[3] += 1.0
+
+            candidate_contents.setdefault(
+                candidate_id_str, []).append(chunk_result.content)
+
+        # For each candidate, average the accumulated scores, then generate
+        # all analysis reports concurrently — the per-candidate AI calls are
+        # independent, so awaiting them one by one serialized the latency
         from services.resume_evaluator import ResumeEvaluatorAgent
         evaluator = ResumeEvaluatorAgent()
-        
-        candidate_results: List[CandidateMatchResult] = []
-        
-        for candidate_id, chunks in candidates_chunks.items():
-            # Aggregate scores from all chunks for this candidate
-            vector_scores = []
-            bm25_scores = []
-            hybrid_scores_list = []
-            
-            for chunk in chunks:
-                # Get hybrid scores from metadata
-                hybrid_scores_data = chunk.metadata.get('hybrid_scores')
-                if hybrid_scores_data:
-                    vector_scores.append(hybrid_scores_data.get('vector_score', 0.0))
-                    bm25_scores.append(hybrid_scores_data.get('bm25_score', 0.0))
-                    hybrid_scores_list.append(hybrid_scores_data.get('hybrid_score', 0.0))
-            
-            # Calculate average scores for the candidate
-            avg_vector_score = sum(vector_scores) / len(vector_scores) if vector_scores else 0.0
-            avg_bm25_score = sum(bm25_scores) / len(bm25_scores) if bm25_scores else 0.0
-            avg_hybrid_score = sum(hybrid_scores_list) / len(hybrid_scores_list) if hybrid_scores_list else 0.0
-            
-            # Create HybridScores object
-            scores = HybridScores(
+
+        candidate_scores: Dict[str, HybridScores] = {}
+        report_tasks = []
+
+        for candidate_id, sums in candidate_score_sums.items():
+            count = sums[3]
+            avg_vector_score = sums[0] / count if count else 0.0
+            avg_bm25_score = sums[1] / count if count else 0.0
+            avg_hybrid_score = sums[2] / count if count else 0.0
+
+            candidate_scores[candidate_id] = HybridScores(
                 vector_score=round(avg_vector_score, 3),
                 bm25_score=round(avg_bm25_score, 3),
                 hybrid_score=round(avg_hybrid_score, 3)
             )
-            
-            # Generate analysis report using AI
+
             # Combine all chunks for full resume content
-            full_resume_content = " ".join([chunk.content for chunk in chunks])
-            
-            report_dict = await evaluator.generate_analysis_report(
+            full_resume_content = " ".join(candidate_contents[candidate_id])
+            report_tasks.append(evaluator.generate_analysis_report(
                 job_description=job_description,
                 resume_content=full_resume_content,
                 hybrid_score=avg_hybrid_score
-            )
-            
-            report = CandidateAnalysisReport(**report_dict)
-            
-            candidate_results.append(CandidateMatchResult(
-                candidate_id=candidate_id,
-                scores=scores,
-                report=report
             ))
+
+        report_dicts = await asyncio.gather(*report_tasks)
+
+        candidate_results: List[CandidateMatchResult] = [
+            CandidateMatchResult(
+                candidate_id=candidate_id,
+                scores=candidate_scores[candidate_id],
+                report=CandidateAnalysisReport(**report_dict)
+            )
+            for candidate_id, report_dict in zip(candidate_scores, report_dicts)
+        ]
         
         # Sort by hybrid score (descending)
         candidate_results.sort(key=lambda x: x.scores.hybrid_score, reverse=True)
@@ -173,11 +179,9 @@ class HybridSearchService:
         for doc in documents:
             doc.page_content = self.text_sanitizer.clean_text(doc.page_content)
 
-        # Add to existing documents
-        self.hybrid_matcher.documents.extend(documents)
-
-        # Re-index all documents
-        await self.hybrid_matcher.index_documents(self.hybrid_matcher.documents)
+        # index_documents appends to the existing store incrementally,
+        # so only the new documents need to be passed in
+        await self.hybrid_matcher.index_documents(documents)
 
     def load_existing_index(self) -> bool:
         """
@@ -188,6 +192,36 @@ class HybridSearchService:
         """
         return self.hybrid_matcher.load_existing_index()
 
+    def ensure_index_loaded(self) -> bool:
+        """
+        Make sure the index is available, loading it from disk only once.
+
+        Returns:
+            True if an index is loaded (or was already loaded), False otherwise
+        """
+        if self.hybrid_matcher.vector_store is not None:
+            return True
+        return self.hybrid_matcher.load_existing_index()
+
+
+# Services cached per persist directory so the convenience functions
+# below don't rebuild a matcher (and reload retriever state) on each call
+_service_cache: Dict[str, HybridSearchService] = {}
+_service_cache_lock = threading.Lock()
+
+
+def get_service(persist_directory: str = "./chroma_db") -> HybridSearchService:
+    """Return the shared HybridSearchService for a persist directory."""
+    service = _service_cache.get(persist_directory)
+    if service is None:
+        with _service_cache_lock:
+            service = _service_cache.get(persist_directory)
+            if service is None:
+                service = HybridSearchService(
+                    persist_directory=persist_directory)
+                _service_cache[persist_directory] = service
+    return service
+
 
 # Convenience functions for direct use
 async def process_resume(
@@ -206,7 +240,7 @@ async def process_resume(
     Returns:
         List of processed LangChain Document objects
     """
-    service = HybridSearchService(persist_directory=persist_directory)
+    service = get_service(persist_directory)
     return await service.process_resume(file_path, metadata)
 
 
@@ -226,7 +260,7 @@ async def find_matches(
     Returns:
         List of CandidateMatchResult objects - one per candidate with three AI evaluation scores
     """
-    service = HybridSearchService(persist_directory=persist_directory)
+    service = get_service(persist_directory)
 
     # Try to load existing index
     index_loaded = service.load_existing_index()
@@ -38,11 +38,12 @@ class InterviewAnalyzer:
         Pipeline:
         1. Download transcript and audio from ElevenLabs
         2. Segment conversation into Q&A pairs using provided questions
-        3. For each Q&A pair:
-           - Run content analysis (parallel with confidence)
-           - Run confidence analysis (parallel with content)
+        3. Judge content validity of all answers in one batched call
+        4. For each Q&A pair:
+           - Reuse the batched content verdict (per-pair call on fallback)
+           - Run confidence analysis
            - Calculate final score
-        4. Return results (frontend will store in Convex)
+        5. Return results (frontend will store in Convex)
 
         Args:
             conversation_id: ElevenLabs conversation ID
@@ -69,14 +70,8 @@ class InterviewAnalyzer:
             # Step 1: Download transcript and audio from ElevenLabs
             logger.info(
                 "Step 1: Downloading transcript and audio from ElevenLabs...")
-            transcript_task = asyncio.create_task(
-                self.elevenlabs_service.download_transcript(conversation_id)
-            )
-            audio_task = asyncio.create_task(
-                self.elevenlabs_service.download_audio(conversation_id)
-            )
-
-            transcript, audio_bytes = await asyncio.gather(transcript_task, audio_task)
+            transcript, audio_bytes = await self.elevenlabs_service.download_all(
+                conversation_id)
 
             if not transcript:
                 raise ValueError(
@@ -103,81 +98,39 @@ class InterviewAnalyzer:
 
             logger.info(f"Found {len(qa_pairs)} Q&A pairs to analyze")
 
-            # Step 4: Analyze each Q&A pair
-            logger.info("Step 4: Analyzing Q&A pairs...")
-            analysis_results = []
-
-            for i, qa_pair in enumerate(qa_pairs):
-                logger.info(
-                    f"Analyzing Q&A pair {i+1}/{len(qa_pairs)}: "
-                    f"question_id={qa_pair['question_id']}"
+            # Step 3: Judge all answers in one batched Gemini round-trip
+            # instead of one call per pair. If the batch call itself blows
+            # up, fall back to per-pair content analysis below.
+            logger.info("Step 3: Analyzing content validity in batch...")
+            try:
+                content_results = await self.content_analyzer.analyze_content_validity_batch([
+                    {
+                        "answer_text": qa_pair["answer_text"],
+                        "expected_keywords": qa_pair.get("expected_keywords", []),
+                        "question_text": qa_pair.get("question_text")
+                    }
+                    for qa_pair in qa_pairs
+                ])
+            except Exception as e:
+                logger.warning(
+                    f"Batch content analysis failed, falling back to "
+                    f"per-pair analysis: {e}"
                 )
+                content_results = [None] * len(qa_pairs)
 
-                try:
-                    # Run content and confidence analysis in parallel
-                    content_task = asyncio.create_task(
-                        self.content_analyzer.analyze_content_validity(
-                            answer_text=qa_pair["answer_text"],
-                            expected_keywords=qa_pair.get(
-                                "expected_keywords", []),
-                            question_text=qa_pair.get("question_text")
-                        )
-                    )
-
-                    # For confidence analysis, we need audio segment
-                    # For now, use full audio (in production, extract segment by timestamp)
-                    # If audio_bytes is None, pass None to use transcript-only analysis
-                    confidence_task = asyncio.create_task(
-                        self.confidence_analyzer.analyze_confidence(
-                            audio_bytes=audio_bytes,
-                            transcript=qa_pair["answer_text"],
-                            audio_format="mp3"
-                        )
-                    )
-
-                    content_result, confidence_result = await asyncio.gather(
-                        content_task,
-                        confidence_task
-                    )
-
-                    # Calculate final score
-                    final_score = self.scorer.calculate_final_score(
-                        content_score=content_result["score"],
-                        confidence_score=confidence_result["score"]
-                    )
+            # Step 4: Analyze all Q&A pairs concurrently — each pair is
+            # independent, so awaiting them one by one made wall time
+            # O(pairs x latency). A semaphore keeps concurrent upstream
+            # calls bounded; gather preserves input order.
+            logger.info("Step 4: Analyzing Q&A pairs...")
+            semaphore = asyncio.Semaphore(8)
 
-                    # Prepare result for frontend to store in Convex
-                    # Note: audio_url should be extracted from ElevenLabs or stored separately
-                    # For now, we'll use a placeholder or the full conversation audio
-                    audio_url = f"elevenlabs://conversations/{conversation_id}"
-
-                    analysis_results.append({
-                        "question_id": qa_pair["question_id"],
-                        "audio_url": audio_url,
-                        "transcription": qa_pair["answer_text"],
-                        "content_score": content_result["score"],
-                        "confidence_score": confidence_result["score"],
-                        "final_score": final_score,
-                        "content_analysis": {
-                            "reasoning": content_result.get("reasoning", ""),
-                            "keywords_found": content_result.get("keywords_found", []),
-                            "keywords_missing": content_result.get("keywords_missing", [])
-                        },
-                        "confidence_analysis": {
-                            "reasoning": confidence_result.get("reasoning", ""),
-                            "metrics": confidence_result.get("metrics", {})
-                        }
-                    })
-
-                except Exception as e:
-                    logger.error(
-                        f"Error analyzing Q&A pair {i+1}: {e}",
-                        exc_info=True
-                    )
-                    analysis_results.append({
-                        "question_id": qa_pair["question_id"],
-                        "error": str(e)
-                    })
+            analysis_results = await asyncio.gather(*(
+                self._analyze_qa_pair(
+                    qa_pair, content_results[i], audio_bytes, conversation_id,
+                    i, len(qa_pairs), semaphore)
+                for i, qa_pair in enumerate(qa_pairs)
+            ))
 
             # Summary
             successful_analyses = [
@@ -208,3 +161,105 @@ class InterviewAnalyzer:
                 "conversation_id": conversation_id,
                 "error": str(e)
             }
+
+    async def _analyze_qa_pair(
+        self,
+        qa_pair: Dict[str, Any],
+        content_result: Optional[Dict[str, Any]],
+        audio_bytes: Optional[bytes],
+        conversation_id: str,
+        index: int,
+        total: int,
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """
+        Analyze a single Q&A pair (content + confidence) and score it.
+
+        Errors are captured per pair so one failed analysis doesn't abort
+        the rest of the batch.
+
+        Args:
+            qa_pair: Segmented Q&A pair with question_id and answer_text
+            content_result: Precomputed content verdict from the batched
+                judge call, or None to run a per-pair analysis here
+            audio_bytes: Full conversation audio (None for transcript-only)
+            conversation_id: ElevenLabs conversation ID
+            index: Zero-based position of this pair (for logging)
+            total: Total number of pairs (for logging)
+            semaphore: Bounds concurrent upstream analysis calls
+
+        Returns:
+            Result dictionary for Convex, or {"question_id", "error"} on failure
+        """
+        async with semaphore:
+            logger.info(
+                f"Analyzing Q&A pair {index+1}/{total}: "
+                f"question_id={qa_pair['question_id']}"
+            )
+
+            try:
+                # For confidence analysis, we need audio segment
+                # For now, use full audio (in production, extract segment by timestamp)
+                # If audio_bytes is None, pass None to use transcript-only analysis
+                confidence_task = asyncio.create_task(
+                    self.confidence_analyzer.analyze_confidence(
+                        audio_bytes=audio_bytes,
+                        transcript=qa_pair["answer_text"],
+                        audio_format="mp3"
+                    )
+                )
+
+                # Content normally arrives from the batched judge call;
+                # run a per-pair analysis (in parallel with confidence)
+                # only when the batch path failed
+                if content_result is None:
+                    content_result, confidence_result = await asyncio.gather(
+                        self.content_analyzer.analyze_content_validity(
+                            answer_text=qa_pair["answer_text"],
+                            expected_keywords=qa_pair.get(
+                                "expected_keywords", []),
+                            question_text=qa_pair.get("question_text")
+                        ),
+                        confidence_task
+                    )
+                else:
+                    confidence_result = await confidence_task
+
+                # Calculate final score
+                final_score = self.scorer.calculate_final_score(
+                    content_score=content_result["score"],
+                    confidence_score=confidence_result["score"]
+                )
+
+                # Prepare result for frontend to store in Convex
+                # Note: audio_url should be extracted from ElevenLabs or stored separately
+                # For now, we'll use a placeholder or the full conversation audio
+                audio_url = f"elevenlabs://conversations/{conversation_id}"
+
+                return {
+                    "question_id": qa_pair["question_id"],
+                    "audio_url": audio_url,
+                    "transcription": qa_pair["answer_text"],
+                    "content_score": content_result["score"],
+                    "confidence_score": confidence_result["score"],
+                    "final_score": final_score,
+                    "content_analysis": {
+                        "reasoning": content_result.get("reasoning", ""),
+                        "keywords_found": content_result.get("keywords_found", []),
+                        "keywords_missing": content_result.get("keywords_missing", [])
+                    },
+                    "confidence_analysis": {
+                        "reasoning": confidence_result.get("reasoning", ""),
+                        "metrics": confidence_result.get("metrics", {})
+                    }
+                }
+
+            except Exception as e:
+                logger.error(
+                    f"Error analyzing Q&A pair {index+1}: {e}",
+                    exc_info=True
+                )
+                return {
+                    "question_id": qa_pair["question_id"],
+                    "error": str(e)
+                }
@@ -7,9 +7,9 @@ import os
 import json
 import asyncio
 from typing import List, Dict, Any, Optional
-from google import genai
 from dotenv import load_dotenv
 from models.question import Question
+from services.gemini_client import get_client
 
 # Load environment variables
 load_dotenv()
@@ -27,7 +27,7 @@ class QuestionGeneratorAgent:
     def __init__(self):
         """Initialize the question generator agent."""
         self.model = 'gemini-2.0-flash-001'
-        self.client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
+        self.client = get_client()
 
     async def extract_context(self, job_description: str) -> Dict[str, Any]:
         """
@@ -52,8 +52,7 @@ Return ONLY a valid JSON object:
 }}"""
 
         try:
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
                 contents=prompt
             )
@@ -181,8 +180,7 @@ Return ONLY a valid JSON array with this exact structure:
 Generate exactly 10-12 questions. expected_keywords should be relevant terms that indicate a good answer."""
 
         try:
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
                 contents=prompt
             )
@@ -268,6 +266,49 @@ Generate exactly 10-12 questions. expected_keywords should be relevant terms tha
 
         return unique_questions
 
+    def _fill_missing_questions(
+        self,
+        questions: List[Dict[str, Any]],
+        job_title: str,
+        hard_skills: List[str],
+        soft_skills: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Pad a short question list up to 10 with standard questions.
+
+        Deduplication can drop model output below the 10-question minimum;
+        rather than re-calling the model (another multi-second round-trip),
+        top up from the same pool the fallback scenario uses, skipping
+        categories already covered.
+
+        Args:
+            questions: Validated question dicts from the model
+            job_title: Job title for templated questions
+            hard_skills: Extracted hard skills (used for keyword hints)
+            soft_skills: Extracted soft skills (unused placeholder pool exists)
+
+        Returns:
+            Question dict list with at least 10 entries
+        """
+        covered_categories = {q.get("category") for q in questions}
+
+        for fallback in self._get_fallback_questions(job_title):
+            if len(questions) >= 10:
+                break
+            if fallback.category in covered_categories:
+                continue
+            expected_keywords = list(fallback.expected_keywords or [])
+            if fallback.category == "technical" and hard_skills:
+                expected_keywords.extend(hard_skills[:5])
+            questions.append({
+                "question_text": fallback.question_text,
+                "category": fallback.category,
+                "expected_keywords": expected_keywords
+            })
+            covered_categories.add(fallback.category)
+
+        return questions
+
     def _get_fallback_questions(self, job_title: str) -> List[Question]:
         """Return fallback questions (10 balanced) if AI generation fails."""
         return [
@@ -6,15 +6,13 @@ import os
 import json
 import asyncio
 from typing import Dict, Optional, Any
-from google import genai
 from dotenv import load_dotenv
 
+from services.gemini_client import get_client
+
 # Load environment variables
 load_dotenv()
 
-# Initialize Google Gemini client
-client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
-
 
 class ResumeEvaluatorAgent:
     """
@@ -28,7 +26,7 @@ class ResumeEvaluatorAgent:
     def __init__(self):
         """Initialize the resume evaluator agent."""
         self.model = 'gemini-2.0-flash-001'
-        self.client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
+        self.client = get_client()
 
     async def evaluate_resume(
         self,
@@ -97,8 +95,7 @@ Be precise and analytical. Base scores on actual content comparison, not assumpt
 
             # Call Gemini API asynchronously
             # Use basic call without temperature/max_output_tokens (model will use defaults)
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
                 contents=prompt
             )
@@ -226,8 +223,7 @@ Return ONLY a valid JSON object with this exact structure:
 Be specific and analytical. Base your analysis on actual content comparison."""
 
             # Call Gemini API
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
                 contents=prompt
             )
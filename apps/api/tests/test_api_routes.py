@@ -5,6 +5,8 @@ import pytest
 from fastapi.testclient import TestClient
 from app.main import app
 
+from routes import hybrid_search as hybrid_search_routes
+
 client = TestClient(app)
 
 
@@ -55,3 +57,63 @@ def test_process_resume_invalid_file():
     # Should reject non-PDF/DOCX files
     assert response.status_code == 400
 
+
+def test_process_resume_oversized_file():
+    """Test process_resume rejects uploads over the size cap with 413."""
+    oversized = b"x" * (hybrid_search_routes.MAX_RESUME_UPLOAD_BYTES + 1)
+    files = {"file": ("big.pdf", oversized, "application/pdf")}
+    response = client.post(
+        "/api/v1/hybrid-search/process-resume",
+        files=files
+    )
+    assert response.status_code == 413
+
+
+class TestMatchesCache:
+    """Tests for the find-matches TTL result cache helpers."""
+
+    def setup_method(self):
+        hybrid_search_routes._invalidate_matches_cache()
+
+    def teardown_method(self):
+        hybrid_search_routes._invalidate_matches_cache()
+
+    def test_put_and_get_round_trip(self):
+        """Test that stored results come back for the same key."""
+        key = ("python developer", 5)
+        hybrid_search_routes._matches_cache_put(key, ["result"])
+        assert hybrid_search_routes._matches_cache_get(key) == ["result"]
+
+    def test_get_misses_for_unknown_key(self):
+        """Test that an unknown key is a clean miss."""
+        assert hybrid_search_routes._matches_cache_get(("unknown", 5)) is None
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries older than the TTL are dropped on read."""
+        key = ("python developer", 5)
+        hybrid_search_routes._matches_cache_put(key, ["result"])
+        cached_at, results = hybrid_search_routes._matches_cache[key]
+        hybrid_search_routes._matches_cache[key] = (
+            cached_at - hybrid_search_routes._MATCHES_CACHE_TTL_SECONDS - 1,
+            results,
+        )
+        assert hybrid_search_routes._matches_cache_get(key) is None
+        assert key not in hybrid_search_routes._matches_cache
+
+    def test_eviction_keeps_cache_bounded(self):
+        """Test that the oldest entries are evicted beyond the cap."""
+        cap = hybrid_search_routes._MATCHES_CACHE_MAX_ENTRIES
+        for i in range(cap + 10):
+            hybrid_search_routes._matches_cache_put((f"job-{i}", 5), [i])
+        assert len(hybrid_search_routes._matches_cache) == cap
+        assert hybrid_search_routes._matches_cache_get(("job-0", 5)) is None
+        assert hybrid_search_routes._matches_cache_get(
+            (f"job-{cap + 9}", 5)) == [cap + 9]
+
+    def test_invalidate_clears_everything(self):
+        """Test that index changes drop all cached results."""
+        hybrid_search_routes._matches_cache_put(("python developer", 5), ["r"])
+        hybrid_search_routes._invalidate_matches_cache()
+        assert hybrid_search_routes._matches_cache_get(
+            ("python developer", 5)) is None
+
@@ -0,0 +1,81 @@
+"""
+Tests for the fast BM25 retriever helpers.
+"""
+import pytest
+
+from langchain_core.documents import Document
+
+from services import fast_bm25
+from services.fast_bm25 import (
+    bm25_docs_with_scores,
+    bm25_retriever_from_documents,
+    delete_bm25_retriever,
+    load_bm25_retriever,
+    save_bm25_retriever,
+)
+
+
+def _sample_docs():
+    return [
+        Document(page_content="Python developer with FastAPI experience",
+                 metadata={"candidate_id": "1"}),
+        Document(page_content="Java engineer building Spring services",
+                 metadata={"candidate_id": "2"}),
+        Document(page_content="Frontend developer using React and TypeScript",
+                 metadata={"candidate_id": "3"}),
+    ]
+
+
+class TestBM25Retrieval:
+    """Tests for retriever construction and scored retrieval."""
+
+    def test_retrieves_relevant_document_first(self):
+        """Test that the best keyword match ranks first."""
+        retriever = bm25_retriever_from_documents(_sample_docs(), k=2)
+        results = retriever.invoke("FastAPI Python")
+        assert results
+        assert "FastAPI" in results[0].page_content
+
+    def test_docs_with_scores_are_descending(self):
+        """Test that scored retrieval returns pairs best-first."""
+        retriever = bm25_retriever_from_documents(_sample_docs(), k=3)
+        scored = bm25_docs_with_scores(retriever, "Python developer", 3)
+        assert scored
+        scores = [score for _, score in scored]
+        assert scores == sorted(scores, reverse=True)
+
+
+@pytest.mark.skipif(fast_bm25.bm25s is None, reason="bm25s not installed")
+class TestBM25Persistence:
+    """Tests for the persisted-index save/load/delete round trip."""
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Test that a loaded index preserves documents and metadata."""
+        save_dir = str(tmp_path / "bm25")
+        retriever = bm25_retriever_from_documents(_sample_docs(), k=2)
+        save_bm25_retriever(retriever, save_dir)
+
+        loaded = load_bm25_retriever(save_dir, k=2)
+        assert loaded is not None
+        assert len(loaded.docs) == 3
+        assert loaded.docs[0].metadata == {"candidate_id": "1"}
+        results = loaded.invoke("FastAPI Python")
+        assert "FastAPI" in results[0].page_content
+
+    def test_load_returns_none_when_nothing_persisted(self, tmp_path):
+        """Test that loading from an empty directory is a clean miss."""
+        assert load_bm25_retriever(str(tmp_path / "missing")) is None
+
+    def test_delete_removes_persisted_index(self, tmp_path):
+        """Test that a deleted index is not reloaded afterwards."""
+        save_dir = str(tmp_path / "bm25")
+        retriever = bm25_retriever_from_documents(_sample_docs(), k=2)
+        save_bm25_retriever(retriever, save_dir)
+        assert load_bm25_retriever(save_dir) is not None
+
+        delete_bm25_retriever(save_dir)
+        assert load_bm25_retriever(save_dir) is None
+
+    def test_delete_tolerates_missing_directory(self, tmp_path):
+        """Test that deleting a never-saved index is a no-op."""
+        delete_bm25_retriever(str(tmp_path / "missing"))
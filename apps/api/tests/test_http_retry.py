@@ -0,0 +1,45 @@
+"""
+Tests for the HTTP retry/backoff helpers.
+"""
+import httpx
+
+from services.http_retry import is_retryable_status, retry_delay
+
+
+class TestRetryDelay:
+    """Tests for backoff computation."""
+
+    def test_honors_retry_after_header(self):
+        """Test that a numeric Retry-After wins over computed backoff."""
+        response = httpx.Response(429, headers={"Retry-After": "7"})
+        assert retry_delay(0, response) == 7.0
+
+    def test_ignores_malformed_retry_after(self):
+        """Test that a non-numeric Retry-After falls back to backoff."""
+        response = httpx.Response(429, headers={"Retry-After": "soon"})
+        assert retry_delay(0, response) < 3.0
+
+    def test_backoff_grows_exponentially(self):
+        """Test that the base delay doubles per attempt (plus jitter)."""
+        assert 1.0 <= retry_delay(0) < 2.0
+        assert 4.0 <= retry_delay(2) < 5.0
+
+    def test_backoff_is_capped(self):
+        """Test that both backoff and Retry-After are capped at 60s."""
+        assert retry_delay(20) == 60.0
+        response = httpx.Response(429, headers={"Retry-After": "600"})
+        assert retry_delay(0, response) == 60.0
+
+
+class TestRetryableStatus:
+    """Tests for status-code classification."""
+
+    def test_retryable_codes(self):
+        """Test that 429 and the common transient 5xx are retryable."""
+        for code in (429, 500, 502, 503, 504):
+            assert is_retryable_status(code)
+
+    def test_non_retryable_codes(self):
+        """Test that success, redirect and client errors are not retried."""
+        for code in (200, 301, 400, 401, 404, 501):
+            assert not is_retryable_status(code)
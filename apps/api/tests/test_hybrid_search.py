@@ -1,19 +1,36 @@
 """
 Tests for hybrid search module.
 """
+import hashlib
 import pytest
 import os
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
 
+from langchain_core.documents import Document
+
 from services.document_loader import DocumentLoader
 from services.text_sanitizer import TextSanitizer
-from services.hybrid_matcher import HybridMatcher
+from services.hybrid_matcher import HybridMatcher, _chunk_ids
 from services.hybrid_search_service import HybridSearchService, process_resume, find_matches
 from models.hybrid_search import CandidateDocument, SearchResult
 
 
+class _StubEmbeddings:
+    """Deterministic hash-based embedder so index tests load no model."""
+
+    def _vector(self, text):
+        digest = hashlib.sha256(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:8]]
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
 class TestTextSanitizer:
     """Tests for TextSanitizer class."""
     
@@ -113,6 +130,44 @@ class TestHybridMatcher:
             await matcher.find_matches("test query", k=5)
 
 
+class TestIndexDeduplication:
+    """Tests for deterministic chunk ids and upsert-on-reindex behavior."""
+
+    def test_chunk_ids_are_deterministic(self):
+        """Test that identical chunks map to identical ids."""
+        doc = Document(page_content="Python developer",
+                       metadata={"candidate_id": "a"})
+        assert _chunk_ids([doc]) == _chunk_ids([doc])
+
+    def test_chunk_ids_distinguish_candidates(self):
+        """Test that shared boilerplate text still indexes per candidate."""
+        first = Document(page_content="References available on request",
+                         metadata={"candidate_id": "a"})
+        second = Document(page_content="References available on request",
+                          metadata={"candidate_id": "b"})
+        ids = _chunk_ids([first, second])
+        assert len(set(ids)) == 2
+
+    @pytest.mark.asyncio
+    async def test_reindexing_same_document_does_not_duplicate(self, tmp_path):
+        """Test that indexing identical content twice upserts in place."""
+        with patch("services.hybrid_matcher._get_embeddings",
+                   return_value=_StubEmbeddings()):
+            matcher = HybridMatcher(
+                persist_directory=str(tmp_path / "chroma"))
+            doc = Document(
+                page_content="Python developer with FastAPI experience",
+                metadata={"candidate_id": "123"}
+            )
+
+            await matcher.index_documents([doc])
+            count_after_first = matcher.vector_store._collection.count()
+            assert count_after_first > 0
+
+            await matcher.index_documents([doc])
+            assert matcher.vector_store._collection.count() == count_after_first
+
+
 class TestHybridSearchService:
     """Tests for HybridSearchService class."""
     